@@ -8,6 +8,8 @@ FastMCP를 사용하여 파일 정리 도구들을 LLM에 노출합니다.
     python server.py
 """
 
+import asyncio
+import inspect
 from fastmcp import FastMCP
 from typing import Optional
 
@@ -18,6 +20,9 @@ from tools import (
     get_dry_run_status,
     configure_workspace,
     config,
+    # 백그라운드 작업
+    submit_job,
+    poll_job,
     # 분석 도구
     list_directory,
     read_file_snippet,
@@ -173,13 +178,16 @@ def tool_analyze_directory_structure(path: str) -> str:
     - 디렉토리 깊이 초과
     - 날짜 접두사 누락 파일
 
+    큰 디렉토리에서도 타임아웃이 나지 않도록 백그라운드 작업으로 실행되며,
+    반환된 job_id로 tool_poll_job을 호출해 결과를 받습니다.
+
     Args:
         path: 분석할 디렉토리 경로
 
     Returns:
-        구조 분석 결과 및 정리 제안
+        작업 시작 메시지 (job_id 포함)
     """
-    return analyze_directory_structure(path)
+    return submit_job("analyze_directory_structure", analyze_directory_structure, path)
 
 
 # ============================================================================
@@ -263,14 +271,35 @@ def tool_batch_rename_with_date(directory: str, use_modified: bool = True) -> st
     - report.docx → 251202_report.docx (수정일 기준)
     - photo.jpg → 241115_photo.jpg (생성일 또는 수정일 기준)
 
+    파일이 많아도 타임아웃이 나지 않도록 백그라운드 작업으로 실행되며,
+    반환된 job_id로 tool_poll_job을 호출해 결과를 받습니다.
+
     Args:
         directory: 대상 디렉토리 경로
         use_modified: True면 수정일, False면 생성일 사용 (기본: True)
 
     Returns:
-        작업 결과 (Dry Run 시 시뮬레이션 결과)
+        작업 시작 메시지 (job_id 포함)
+    """
+    return submit_job(
+        "batch_rename_with_date", batch_rename_with_date, directory, use_modified
+    )
+
+
+@mcp.tool()
+def tool_poll_job(job_id: str) -> str:
     """
-    return batch_rename_with_date(directory, use_modified)
+    백그라운드 작업의 진행 상황과 결과를 확인합니다.
+    tool_analyze_directory_structure, tool_batch_rename_with_date가
+    반환한 job_id를 사용합니다.
+
+    Args:
+        job_id: 확인할 작업 ID
+
+    Returns:
+        실행 중이면 진행 상황, 완료되면 작업 결과
+    """
+    return poll_job(job_id)
 
 
 # ============================================================================
@@ -420,6 +449,120 @@ def tool_group_files_into_folder(
     return group_files_into_folder(directory, folder_name, file_names)
 
 
+# ============================================================================
+# 일괄 실행 도구 등록 (Batch Execution)
+# ============================================================================
+
+# 일괄 실행 시 MCP 왕복 없이 직접 호출할 도구 함수
+_LOCAL_DISPATCH = {
+    "list_directory": list_directory,
+    "read_file_snippet": read_file_snippet,
+    "get_image_metadata": get_image_metadata,
+    "analyze_directory_structure": analyze_directory_structure,
+    "move_file": move_file,
+    "rename_file": rename_file,
+    "create_folder": create_folder,
+    "batch_rename_with_date": batch_rename_with_date,
+    "find_files_needing_rename": find_files_needing_rename,
+    "suggest_filename_from_content": suggest_filename_from_content,
+    "analyze_file_relationships": analyze_file_relationships,
+    "rename_with_suggestion": rename_with_suggestion,
+    "group_files_into_folder": group_files_into_folder,
+}
+
+# 동시에 실행해도 안전한 읽기 전용 도구
+_READ_ONLY_TOOLS = frozenset({
+    "list_directory",
+    "read_file_snippet",
+    "get_image_metadata",
+    "analyze_directory_structure",
+    "find_files_needing_rename",
+    "suggest_filename_from_content",
+    "analyze_file_relationships",
+})
+
+
+def _call_local(func, args: dict) -> str:
+    """도구 함수를 직접 호출하고 인자 오류를 결과 메시지로 변환합니다."""
+    # 인자 검사는 호출 전에 따로 수행 (도구 내부에서 발생한 TypeError를 인자 오류로 오인하지 않도록)
+    try:
+        bound = inspect.signature(func).bind(**args)
+    except TypeError as e:
+        return f"[ERROR] 인자 오류: {str(e)}"
+    try:
+        return func(*bound.args, **bound.kwargs)
+    except Exception as e:
+        return f"[ERROR] 실행 오류: {str(e)}"
+
+
+@mcp.tool()
+async def tool_batch_execute(operations: list[dict], max_concurrent: int = 4) -> str:
+    """
+    여러 도구 호출을 한 번의 요청으로 일괄 실행합니다.
+    도구마다 MCP 왕복을 반복하지 않아도 되므로 대량 작업에 유용합니다.
+
+    실행 방식:
+    - 변경 작업(이동, 이름 변경 등)은 요청 순서대로 하나씩 실행
+    - 연속된 읽기 전용 작업은 max_concurrent 개까지 동시에 실행
+    - Dry Run 모드 등 기존 안전 기능은 그대로 적용
+
+    Args:
+        operations: 실행할 작업 목록
+            (예: [{"tool": "rename_file", "args": {"path": "...", "new_name": "..."}}])
+            tool 이름은 'tool_' 접두사 없이 또는 포함하여 지정할 수 있습니다.
+        max_concurrent: 읽기 전용 작업의 최대 동시 실행 수 (기본: 4)
+
+    Returns:
+        각 작업의 실행 결과
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    results = [None] * len(operations)
+
+    async def run_read_only(index: int, func, args: dict):
+        async with semaphore:
+            results[index] = await loop.run_in_executor(None, _call_local, func, args)
+
+    pending_reads = []
+    names = []
+
+    for index, op in enumerate(operations):
+        if not isinstance(op, dict):
+            names.append("?")
+            results[index] = "[ERROR] 작업은 {'tool': ..., 'args': {...}} 형식이어야 합니다."
+            continue
+
+        name = str(op.get("tool", "")).removeprefix("tool_")
+        names.append(name)
+        func = _LOCAL_DISPATCH.get(name)
+        args = op.get("args") or {}
+
+        if func is None:
+            results[index] = f"[ERROR] 일괄 실행을 지원하지 않는 도구입니다: {op.get('tool')}"
+            continue
+
+        if name in _READ_ONLY_TOOLS:
+            pending_reads.append(run_read_only(index, func, args))
+            continue
+
+        # 변경 작업 전에 앞선 읽기 작업을 모두 끝내 순서를 보장
+        if pending_reads:
+            await asyncio.gather(*pending_reads)
+            pending_reads = []
+
+        results[index] = await loop.run_in_executor(None, _call_local, func, args)
+
+    if pending_reads:
+        await asyncio.gather(*pending_reads)
+
+    result_lines = [f"[BATCH] 일괄 실행 결과: {len(operations)}개 작업"]
+    for index, (name, result) in enumerate(zip(names, results), start=1):
+        result_lines.append(f"\n[{index}] {name}")
+        result_lines.append(result)
+
+    return "\n".join(result_lines)
+
+
 # ============================================================================
 # 프롬프트 리소스 등록
 # ============================================================================
@@ -487,7 +630,7 @@ def get_workflow_guide() -> str:
 ## 1단계: 준비
 1. `tool_configure_workspace`로 작업 영역 설정
 2. `tool_get_status`로 Dry Run 활성화 확인
-3. `tool_analyze_directory_structure`로 현황 파악
+3. `tool_analyze_directory_structure`로 현황 파악 (반환된 job_id로 `tool_poll_job` 호출)
 
 ## 2단계: 지능형 분석 및 정리
 1. **의미 불명 파일 찾기**:
@@ -504,7 +647,9 @@ def get_workflow_guide() -> str:
 2. **그룹핑 실행**:
    - `tool_group_files_into_folder`로 주제별 폴더 이동
 3. **일괄 날짜 처리**:
-   - 필요 시 `tool_batch_rename_with_date` 실행
+   - 필요 시 `tool_batch_rename_with_date` 실행 (결과는 `tool_poll_job`으로 확인)
+4. **일괄 실행**:
+   - 여러 이름 변경/이동 작업은 `tool_batch_execute`로 한 번에 요청
 
 ## 4단계: 실행 (Dry Run 해제)
 1. **최종 확인**: 사용자에게 계획된 작업 승인 요청
@@ -550,7 +695,8 @@ if __name__ == "__main__":
         "   [Action] tool_move_file, tool_rename_file, tool_create_folder",
         file=sys.stderr,
     )
-    print("   [Action] tool_batch_rename_with_date", file=sys.stderr)
+    print("   [Action] tool_batch_rename_with_date, tool_poll_job", file=sys.stderr)
+    print("   [Batch]  tool_batch_execute", file=sys.stderr)
     print("", file=sys.stderr)
     print("[NOTE] Dry Run mode is ENABLED by default.", file=sys.stderr)
     print(
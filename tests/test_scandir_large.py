@@ -0,0 +1,84 @@
+"""
+scandir_large의 getdents64 경로 테스트
+임계값을 낮춰 큰 디렉토리가 아니어도 getdents64 분기를 실행하고 os.scandir 결과와 비교합니다.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import utils
+
+
+@unittest.skipIf(utils._get_getdents64() is None, "getdents64를 사용할 수 없는 플랫폼")
+class ScandirLargeGetdentsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        # 이름 길이가 다양해야 d_reclen 정렬/패딩 처리가 검증됨
+        for name in ["a", "ab.txt", "한글_파일이름.md", "x" * 200, "공백 있는 이름.pdf"]:
+            Path(self.root, name).write_bytes(b"data")
+        os.mkdir(os.path.join(self.root, "sub_dir"))
+        os.symlink("ab.txt", os.path.join(self.root, "link_to_file"))
+        os.symlink("sub_dir", os.path.join(self.root, "link_to_dir"))
+        os.symlink("missing", os.path.join(self.root, "broken_link"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _describe(self, entries):
+        return {
+            e.name: (
+                e.path,
+                e.inode(),
+                e.is_file(),
+                e.is_dir(),
+                e.is_symlink(),
+                e.is_file(follow_symlinks=False),
+                e.is_dir(follow_symlinks=False),
+            )
+            for e in entries
+        }
+
+    def test_getdents_branch_matches_scandir(self):
+        with mock.patch.object(utils, "_LARGE_DIR_BYTES", 0):
+            entries = list(utils.scandir_large(self.root))
+        self.assertTrue(all(isinstance(e, utils.RawDirEntry) for e in entries))
+        with os.scandir(self.root) as it:
+            expected = self._describe(it)
+        self.assertEqual(self._describe(entries), expected)
+
+    def test_many_entries_span_multiple_reads(self):
+        names = {f"file_{i:05d}_{'y' * 40}" for i in range(3000)}
+        for name in names:
+            Path(self.root, name).touch()
+        with mock.patch.object(utils, "_LARGE_DIR_BYTES", 0), \
+                mock.patch.object(utils, "_GETDENTS_BUFFER_SIZE", 4096):
+            found = {e.name for e in utils.scandir_large(self.root)}
+        self.assertTrue(names <= found)
+        self.assertEqual(len(found), len(os.listdir(self.root)))
+
+    def test_stat_matches_os_stat(self):
+        with mock.patch.object(utils, "_LARGE_DIR_BYTES", 0):
+            entries = {e.name: e for e in utils.scandir_large(self.root)}
+        link = entries["link_to_file"]
+        self.assertEqual(link.stat().st_ino, os.stat(link.path).st_ino)
+        self.assertEqual(
+            link.stat(follow_symlinks=False).st_ino, os.lstat(link.path).st_ino
+        )
+        self.assertEqual(os.fspath(link), link.path)
+
+    def test_dir_size_argument_selects_branch(self):
+        entries = list(utils.scandir_large(self.root, dir_size=utils._LARGE_DIR_BYTES))
+        self.assertTrue(all(isinstance(e, utils.RawDirEntry) for e in entries))
+        entries = list(utils.scandir_large(self.root, dir_size=0))
+        self.assertFalse(any(isinstance(e, utils.RawDirEntry) for e in entries))
+
+
+if __name__ == "__main__":
+    unittest.main()
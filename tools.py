@@ -3,21 +3,22 @@ tools.py - 파일 정리 MCP 서버의 도구 함수들
 분석 도구와 액션 도구를 구현합니다.
 """
 
+import errno
+import json
 import os
 import shutil
+import stat
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-
-# 이미지 메타데이터용 (선택적)
-try:
-    from PIL import Image as PILImage
-    from PIL.ExifTags import TAGS
-
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from functools import wraps
+from io import StringIO
 
 # FastMCP Image type for proper image content handling
 try:
@@ -28,9 +29,13 @@ except ImportError:
 
 from utils import (
     validate_path,
+    fast_resolve_str,
     get_file_dates,
-    read_file_with_encoding,
-    is_binary_file,
+    stat_and_dates,
+    is_binary_bytes,
+    BINARY_SNIFF_BYTES,
+    read_file_head,
+    decode_text_bytes,
     get_file_size_str,
     check_directory_depth,
     validate_folder_naming,
@@ -38,14 +43,28 @@ from utils import (
     sanitize_filename,
     get_target_root,
     set_target_root,
+    pinned_target_root,
+    get_dir_cache,
+    has_date_prefix,
+    cached_by_mtime,
+    notify_fs_changed,
+    get_cached_image,
+    put_cached_image,
+    split_extension,
+    scandir_large,
     # New utilities for enhanced features
     read_docx_content,
     read_pdf_content,
+    read_pdf_metadata,
+    pil_image_module,
+    open_for_parsing,
     encode_image_to_base64,
-    get_readable_extensions,
-    get_image_extensions,
+    READABLE_EXTENSIONS,
+    IMAGE_EXTENSIONS,
+    binary_by_extension,
     analyze_filename_patterns,
     is_meaningless_filename,
+    read_exif_fast,
 )
 
 
@@ -55,11 +74,20 @@ class ToolConfig:
 
     dry_run: bool = True  # 기본값: Dry Run 모드 활성화
     max_depth: int = 5  # 최대 디렉토리 깊이
+    scan_workers: int = 8  # 디렉토리 스캔 병렬 스레드 수
+    rename_workers: int = 4  # 일괄 이름 변경/그룹 이동 병렬 스레드 수
 
 
 # 전역 설정 인스턴스
 config = ToolConfig()
 
+# 확장자 집합 (호출마다 set을 새로 만들지 않도록 import 시 한 번만 생성)
+_READABLE_EXTS = READABLE_EXTENSIONS
+_IMAGE_EXTS = IMAGE_EXTENSIONS
+_ANALYZABLE_EXTS = _READABLE_EXTS | _IMAGE_EXTS
+# EXIF 메타데이터를 조회할 수 있는 이미지 확장자
+_METADATA_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"})
+
 
 def set_dry_run(enabled: bool) -> str:
     """
@@ -106,11 +134,174 @@ def configure_workspace(root_path: str) -> str:
         return f"[ERROR] 경로가 디렉토리가 아닙니다: {root_path}"
 
     if set_target_root(root_path):
-        return f"[OK] 작업 영역이 설정되었습니다: {path.resolve()}\n모든 파일 작업은 이 디렉토리 내에서만 허용됩니다."
+        return f"[OK] 작업 영역이 설정되었습니다: {get_target_root()}\n모든 파일 작업은 이 디렉토리 내에서만 허용됩니다."
     else:
         return f"[ERROR] 작업 영역 설정 실패: {root_path}"
 
 
+# ============================================================================
+# 백그라운드 작업 (Background Jobs)
+# ============================================================================
+
+
+@dataclass
+class JobProgress:
+    """백그라운드 작업의 진행 상황 카운터"""
+
+    done: int = 0
+    total: int = 0
+
+
+@dataclass
+class Job:
+    """백그라운드로 실행 중인 도구 호출"""
+
+    name: str
+    future: Future
+    progress: JobProgress = field(default_factory=JobProgress)
+    finished_at: Optional[float] = None  # 완료 시각 (time.monotonic), 실행 중이면 None
+
+
+# 오래 걸리는 작업은 MCP 클라이언트 타임아웃을 피하기 위해 작업 큐에서 실행
+# 작업 간 파일 변경 순서를 보장하기 위해 한 번에 하나씩 실행합니다.
+_JOB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-agent-job")
+_JOBS: dict[str, Job] = {}
+_JOBS_LOCK = threading.Lock()
+# 조회되지 않은 완료 작업의 결과 보관 기간(초)과 최대 보관 개수
+_JOB_RESULT_TTL = 3600
+_JOBS_MAX_FINISHED = 64
+
+# 작업 스레드에서 사용할 제출 시점의 dry_run 값
+_JOB_STATE = threading.local()
+
+# 파일 시스템을 실제로 변경하는 구간은 이 잠금 안에서 하나씩 실행합니다.
+# 동기 도구(move_file, rename_file 등)와 작업 큐의 일괄 이름 변경이 같은 폴더를
+# 동시에 바꾸면 충돌 검사가 무의미해지므로 실행 순서를 직렬화합니다.
+# 동기 도구는 서버 전체를 멈추지 않도록 제한 시간 동안만 기다립니다.
+_MUTATION_LOCK = threading.RLock()
+_MUTATION_LOCK_TIMEOUT = 5.0
+_MUTATION_BUSY_MESSAGE = "[ERROR] 다른 작업이 진행 중입니다. 잠시 후 다시 시도하세요."
+
+
+def _is_dry_run() -> bool:
+    """현재 실행에 적용되는 dry_run 값 (백그라운드 작업은 제출 시점의 값)"""
+    return getattr(_JOB_STATE, "dry_run", config.dry_run)
+
+
+def _acquire_mutation_lock() -> bool:
+    """
+    _MUTATION_LOCK을 획득합니다.
+    백그라운드 작업은 끝까지 기다리고, 동기 도구 호출은 제한 시간이 지나면 False를 반환합니다.
+    """
+    if hasattr(_JOB_STATE, "dry_run"):
+        return _MUTATION_LOCK.acquire()
+    return _MUTATION_LOCK.acquire(timeout=_MUTATION_LOCK_TIMEOUT)
+
+
+def _serialized(func):
+    """
+    파일 시스템 변경 도구를 _MUTATION_LOCK 안에서 실행하는 데코레이터
+    (Dry Run에서는 파일을 바꾸지 않으므로 잠금 없이 실행)
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _is_dry_run():
+            return func(*args, **kwargs)
+        if not _acquire_mutation_lock():
+            return _MUTATION_BUSY_MESSAGE
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _MUTATION_LOCK.release()
+
+    return wrapper
+
+
+def _run_job(func, args: tuple, progress: JobProgress, dry_run: bool, root: Optional[Path]):
+    """제출 시점의 dry_run과 작업 영역을 고정한 채 func를 실행"""
+    _JOB_STATE.dry_run = dry_run
+    try:
+        with pinned_target_root(root):
+            return func(*args, progress=progress)
+    finally:
+        del _JOB_STATE.dry_run
+
+
+def submit_job(name: str, func, *args) -> str:
+    """
+    도구 함수를 백그라운드 작업으로 실행합니다.
+    func는 progress 키워드 인자로 JobProgress를 받아야 합니다.
+
+    Returns:
+        작업 시작 메시지 (job_id 포함)
+    """
+    progress = JobProgress()
+    # 대기 중에 set_dry_run/configure_workspace가 호출되어도 요청 당시 설정으로 실행
+    future = _JOB_EXECUTOR.submit(
+        _run_job, func, args, progress, config.dry_run, get_target_root()
+    )
+    job_id = uuid.uuid4().hex
+    job = Job(name=name, future=future, progress=progress)
+    with _JOBS_LOCK:
+        _prune_jobs()
+        _JOBS[job_id] = job
+    future.add_done_callback(lambda _: setattr(job, "finished_at", time.monotonic()))
+    return (
+        f"[JOB] 작업이 시작되었습니다: {name}\n"
+        f"   job_id: {job_id}\n"
+        f"   poll_job(job_id)로 진행 상황과 결과를 확인하세요."
+    )
+
+
+def _prune_jobs() -> None:
+    """
+    조회되지 않은 완료 작업을 정리합니다. (_JOBS_LOCK을 잡은 상태에서 호출)
+    보관 기간이 지난 작업을 지우고, 그래도 많으면 오래된 완료 작업부터 제거합니다.
+    """
+    now = time.monotonic()
+    finished = sorted(
+        (job.finished_at, job_id)
+        for job_id, job in _JOBS.items()
+        if job.finished_at is not None
+    )
+    excess = len(finished) - _JOBS_MAX_FINISHED
+    for index, (finished_at, job_id) in enumerate(finished):
+        if index < excess or now - finished_at > _JOB_RESULT_TTL:
+            del _JOBS[job_id]
+
+
+def poll_job(job_id: str) -> str:
+    """
+    백그라운드 작업의 상태를 확인합니다.
+    완료된 작업은 결과를 반환한 뒤 목록에서 제거됩니다.
+    (조회되지 않은 완료 작업도 _JOB_RESULT_TTL이 지나면 정리됩니다.)
+
+    Args:
+        job_id: submit_job이 반환한 작업 ID
+
+    Returns:
+        진행 상황 또는 작업 결과
+    """
+    with _JOBS_LOCK:
+        _prune_jobs()
+        job = _JOBS.get(job_id)
+        if job is None:
+            return f"[ERROR] 알 수 없는 작업 ID입니다: {job_id}"
+
+        if not job.future.done():
+            progress = job.progress
+            progress_msg = f" ({progress.done}/{progress.total})" if progress.total else ""
+            return f"[JOB] 실행 중: {job.name}{progress_msg}\n   잠시 후 다시 확인하세요."
+
+        del _JOBS[job_id]
+    try:
+        result = job.future.result()
+    except Exception as e:
+        return f"[ERROR] 작업 실패: {job.name}: {str(e)}"
+    return f"[JOB] 완료: {job.name}\n\n{result}"
+
+
 # ============================================================================
 # 분석 도구 (Read-Only Tools)
 # ============================================================================
@@ -137,66 +328,77 @@ def list_directory(path: str, show_hidden: bool = False) -> str:
     if not target.is_dir():
         return f"[ERROR] '{path}'는 디렉토리가 아닙니다."
 
+    # 폴더와 파일 분리 (한 번의 순회에서 DirEntry의 캐시된 타입 정보로 분류)
+    # DirEntry는 항목당 stat 결과를 한 번만 가져와 캐시합니다.
+    folders = []
+    files = []
     try:
-        items = list(target.iterdir())
+        with os.scandir(target) as it:
+            for entry in it:
+                if not show_hidden and entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    folders.append(entry)
+                elif entry.is_file():
+                    files.append(entry)
     except PermissionError:
         return f"[ERROR] 권한 오류: '{path}'에 접근할 수 없습니다."
 
-    if not show_hidden:
-        items = [item for item in items if not item.name.startswith(".")]
-
-    # 폴더와 파일 분리
-    folders = sorted([i for i in items if i.is_dir()], key=lambda x: x.name.lower())
-    files = sorted([i for i in items if i.is_file()], key=lambda x: x.name.lower())
+    folders.sort(key=lambda x: x.name.lower())
+    files.sort(key=lambda x: x.name.lower())
 
     # 깊이 확인
     depth_ok, current_depth = check_directory_depth(target)
 
-    result_lines = [
-        f"[DIR] 디렉토리: {target}",
-        f"   현재 깊이: {current_depth}/{config.max_depth} {'[OK]' if depth_ok else '[WARNING] 최대 깊이 초과'}",
-        f"   폴더: {len(folders)}개, 파일: {len(files)}개",
-        "",
-    ]
+    # 항목 수에 비례해 출력이 커지므로 줄 리스트 대신 하나의 버퍼에 기록
+    # (각 줄은 앞에 개행을 붙여 기록 - "\n".join과 동일한 결과)
+    out = StringIO()
+    out.write(
+        f"[DIR] 디렉토리: {target}\n"
+        f"   현재 깊이: {current_depth}/{config.max_depth} {'[OK]' if depth_ok else '[WARNING] 최대 깊이 초과'}\n"
+        f"   폴더: {len(folders)}개, 파일: {len(files)}개\n"
+    )
 
     # 폴더 나열
     if folders:
-        result_lines.append("[FOLDER] 폴더:")
+        out.write("\n[FOLDER] 폴더:")
         for folder in folders:
             try:
                 dates = get_file_dates(folder)
                 is_valid, _ = validate_folder_naming(folder.name)
                 naming_icon = "[OK]" if is_valid else "[WARN]"
-                result_lines.append(
-                    f"   {naming_icon} {folder.name}/ "
+                out.write(
+                    f"\n   {naming_icon} {folder.name}/ "
                     f"(생성: {dates['created_str']}, 수정: {dates['modified_str']})"
                 )
             except Exception:
-                result_lines.append(f"   [?] {folder.name}/")
+                out.write(f"\n   [?] {folder.name}/")
 
     # 파일 나열
     if files:
-        result_lines.append("\n[FILE] 파일:")
+        out.write("\n\n[FILE] 파일:")
         for file in files:
             try:
-                dates = get_file_dates(file)
-                size = get_file_size_str(file.stat().st_size)
-                ext = file.suffix.lower() if file.suffix else "(없음)"
-                result_lines.append(
-                    f"   • {file.name}\n"
+                st = file.stat()
+                dates = get_file_dates(file, st)
+                size = get_file_size_str(st.st_size)
+                stem, suffix = split_extension(file.name)
+                ext = suffix.lower() if suffix else "(없음)"
+                out.write(
+                    f"\n   • {file.name}\n"
                     f"     크기: {size} | 확장자: {ext}\n"
                     f"     생성: {dates['created_str']} | 수정: {dates['modified_str']}\n"
-                    f"     YYMMDD 형식 제안: {dates['modified_str']}_{file.stem}{file.suffix}"
+                    f"     YYMMDD 형식 제안: {dates['modified_str']}_{stem}{suffix}"
                 )
             except Exception as e:
-                result_lines.append(f"   • {file.name} (정보 읽기 실패: {e})")
+                out.write(f"\n   • {file.name} (정보 읽기 실패: {e})")
 
     # 폴더 번호 제안
     folder_names = [f.name for f in folders]
     next_prefix = suggest_folder_prefix(folder_names)
-    result_lines.append(f"\n[SUGGEST] 다음 폴더 번호 제안: {next_prefix}_NewFolder")
+    out.write(f"\n\n[SUGGEST] 다음 폴더 번호 제안: {next_prefix}_NewFolder")
 
-    return "\n".join(result_lines)
+    return out.getvalue()
 
 
 def read_file_snippet(path: str, max_length: int = 5000) -> str:
@@ -220,17 +422,29 @@ def read_file_snippet(path: str, max_length: int = 5000) -> str:
     if not target.is_file():
         return f"[ERROR] '{path}'는 파일이 아닙니다."
 
-    # 바이너리 파일 체크
-    if is_binary_file(target):
-        size = get_file_size_str(target.stat().st_size)
-        return f"[BINARY] 바이너리 파일입니다.\n파일명: {target.name}\n크기: {size}\n내용을 텍스트로 표시할 수 없습니다."
-
+    # 한 번 열어 fstat과 앞부분 읽기를 함께 수행
+    # (바이너리 판별은 앞 8KB, 디코딩은 max_length 글자 분량만 사용)
+    read_size = max_length * 4
     try:
-        content, encoding = read_file_with_encoding(target, max_length)
-        dates = get_file_dates(target)
+        # 확장자로 바이너리임을 알 수 있으면 파일을 열지 않고 stat만 수행
+        if binary_by_extension(target.name):
+            size = get_file_size_str(target.stat().st_size)
+            return f"[BINARY] 바이너리 파일입니다.\n파일명: {target.name}\n크기: {size}\n내용을 텍스트로 표시할 수 없습니다."
+
+        raw, st = read_file_head(target, max(read_size, BINARY_SNIFF_BYTES))
+
+        # 바이너리 파일 체크
+        if is_binary_bytes(raw):
+            size = get_file_size_str(st.st_size)
+            return f"[BINARY] 바이너리 파일입니다.\n파일명: {target.name}\n크기: {size}\n내용을 텍스트로 표시할 수 없습니다."
+
+        content, encoding = decode_text_bytes(
+            raw[:read_size], max_length, is_complete=len(raw) < read_size
+        )
+        dates = get_file_dates(target, st)
 
         # 내용이 잘렸는지 확인
-        total_size = target.stat().st_size
+        total_size = st.st_size
         truncated = len(content) < total_size
 
         result_lines = [
@@ -258,6 +472,36 @@ def read_file_snippet(path: str, max_length: int = 5000) -> str:
         return f"[ERROR] 파일 읽기 오류: {str(e)}"
 
 
+# EXIF 하위 IFD 포인터 태그 (DateTimeOriginal 등 촬영 정보가 위치)
+_EXIF_SUB_IFD_TAG = 0x8769
+_TAG_DATETIME_ORIGINAL = 0x9003
+
+# 관심 있는 EXIF 태그 (태그 ID -> 표시 이름)
+_IMPORTANT_TAG_IDS = {
+    _TAG_DATETIME_ORIGINAL: "촬영일시",  # DateTimeOriginal
+    0x0132: "날짜시간",  # DateTime
+    0x9004: "디지털화일시",  # DateTimeDigitized
+    0x010F: "제조사",  # Make
+    0x0110: "모델",  # Model
+    0x0100: "너비",  # ImageWidth
+    0x0101: "높이",  # ImageLength
+    0x0112: "방향",  # Orientation
+}
+
+
+def _read_exif_with_pil(img) -> dict:
+    """
+    PIL 공개 API(getexif)로 IFD0과 Exif 하위 IFD 태그를 읽습니다.
+    비공개 _getexif()와 달리 모든 포맷에서 동작하며, 헤더만 파싱하고 픽셀은 디코딩하지 않습니다.
+    """
+    exif = img.getexif()
+    if not exif:
+        return {}
+    exif_data = dict(exif)
+    exif_data.update(exif.get_ifd(_EXIF_SUB_IFD_TAG))
+    return exif_data
+
+
 def get_image_metadata(path: str) -> str:
     """
     이미지 파일의 EXIF 메타데이터를 추출합니다.
@@ -269,7 +513,9 @@ def get_image_metadata(path: str) -> str:
     Returns:
         이미지 메타데이터 정보
     """
-    if not PIL_AVAILABLE:
+    # 이미지 메타데이터용 (선택적, 처음 사용할 때 불러옴)
+    PILImage = pil_image_module()
+    if PILImage is None:
         return "[ERROR] Pillow 라이브러리가 설치되지 않았습니다.\n'pip install Pillow' 명령으로 설치하세요."
 
     validation = validate_path(path, must_exist=True)
@@ -282,8 +528,7 @@ def get_image_metadata(path: str) -> str:
         return f"[ERROR] '{path}'는 파일이 아닙니다."
 
     # 이미지 확장자 확인
-    image_extensions = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"}
-    if target.suffix.lower() not in image_extensions:
+    if target.suffix.lower() not in _METADATA_IMAGE_EXTS:
         return f"[ERROR] '{target.name}'은 지원되는 이미지 형식이 아닙니다."
 
     try:
@@ -295,34 +540,24 @@ def get_image_metadata(path: str) -> str:
                 f"   모드: {img.mode}",
             ]
 
-            # EXIF 데이터 추출
-            exif_data = img._getexif()
+            # EXIF 데이터 추출 (APP1/eXIf 직접 파싱, 불가능하면 PIL 사용)
+            exif_data = read_exif_fast(target)
+            if exif_data is None:
+                exif_data = _read_exif_with_pil(img)
             if exif_data:
                 result_lines.append("\n[EXIF] EXIF 데이터:")
 
-                # 관심 있는 태그들
-                important_tags = {
-                    "DateTimeOriginal": "촬영일시",
-                    "DateTime": "날짜시간",
-                    "DateTimeDigitized": "디지털화일시",
-                    "Make": "제조사",
-                    "Model": "모델",
-                    "ImageWidth": "너비",
-                    "ImageLength": "높이",
-                    "Orientation": "방향",
-                }
-
                 date_taken = None
 
                 for tag_id, value in exif_data.items():
-                    tag_name = TAGS.get(tag_id, tag_id)
-                    if tag_name in important_tags:
-                        korean_name = important_tags[tag_name]
-                        result_lines.append(f"   {korean_name}: {value}")
+                    korean_name = _IMPORTANT_TAG_IDS.get(tag_id)
+                    if korean_name is None:
+                        continue
+                    result_lines.append(f"   {korean_name}: {value}")
 
-                        # 촬영 날짜 저장
-                        if tag_name == "DateTimeOriginal":
-                            date_taken = value
+                    # 촬영 날짜 저장
+                    if tag_id == _TAG_DATETIME_ORIGINAL:
+                        date_taken = value
 
                 if date_taken:
                     try:
@@ -348,12 +583,15 @@ def get_image_metadata(path: str) -> str:
         return f"[ERROR] 이미지 읽기 오류: {str(e)}"
 
 
-def analyze_directory_structure(path: str) -> str:
+def analyze_directory_structure(
+    path: str, progress: Optional[JobProgress] = None
+) -> str:
     """
     디렉토리 구조를 분석하고 정리 제안을 제공합니다.
 
     Args:
         path: 분석할 디렉토리 경로
+        progress: 진행 상황 카운터 (백그라운드 작업용, 선택적)
 
     Returns:
         구조 분석 결과 및 정리 제안
@@ -371,51 +609,109 @@ def analyze_directory_structure(path: str) -> str:
     stats = {
         "total_files": 0,
         "total_folders": 0,
-        "extensions": {},
+        "extensions": Counter(),
         "naming_issues": [],
         "depth_issues": [],
         "files_without_date": [],
     }
 
-    import re
-
-    date_pattern = re.compile(r"^\d{6}_")
-
-    def scan_recursive(dir_path: Path, depth: int = 0):
+    # 탐색 루프에서는 Path 대신 문자열 경로 사용 (항목별 Path 객체 생성 방지)
+    root_str = str(target)
+
+    # 하위 트리의 캐시 행은 한 번의 쿼리로 읽고, 새로 스캔한 결과는 끝에 한 번에 기록
+    dir_cache = get_dir_cache()
+    cached_rows = dir_cache.load_subtree(root_str)
+    new_rows = []
+    scanned_paths = set()
+
+    # 캐시 항목 종류: 0=파일, 1=디렉토리, 2=심볼릭 링크 디렉토리 (하위 탐색 안 함)
+    def list_entries(abs_path: str) -> tuple:
+        # 디렉토리 mtime이 캐시와 같으면 scandir()/stat() 없이 목록 재사용
+        st = os.stat(abs_path)
+        cached = cached_rows.get(abs_path)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            entries = json.loads(cached[1])
+        else:
+            entries = []
+            with os.scandir(abs_path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        entries.append([entry.name, 2 if entry.is_symlink() else 1])
+                    elif entry.is_file():
+                        entries.append([entry.name, 0])
+            new_rows.append((abs_path, st.st_mtime_ns, entries))
+        scanned_paths.add(abs_path)
+        return (st.st_dev, st.st_ino), entries
+
+    def fetch_listing(dir_path: str) -> tuple:
         try:
-            for item in dir_path.iterdir():
-                if item.name.startswith("."):
+            dir_key, entries = list_entries(dir_path)
+        except PermissionError:
+            return None, []
+        return dir_key, [entry for entry in entries if not entry[0].startswith(".")]
+
+    # 디렉토리 목록 조회(I/O)는 스레드 풀에서 병렬로 수행
+    if progress is None:
+        progress = JobProgress()
+
+    listings = {}
+    # 이미 탐색한 디렉토리 (st_dev, st_ino) - 하드링크/정션 등으로 인한 중복·순환 방지
+    visited = set()
+    with ThreadPoolExecutor(max_workers=config.scan_workers) as executor:
+        pending = {executor.submit(fetch_listing, root_str): root_str}
+        progress.total = 1
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_path = pending.pop(future)
+                dir_key, entries = future.result()
+                progress.done += 1
+                if dir_key in visited:
                     continue
+                visited.add(dir_key)
+                listings[dir_path] = entries
+                for name, kind in entries:
+                    if kind == 1:
+                        child = os.path.join(dir_path, name)
+                        pending[executor.submit(fetch_listing, child)] = child
+                        progress.total += 1
+
+    dir_cache.store_scan(root_str, cached_rows, new_rows, scanned_paths)
+
+    # 통계 집계는 깊이 우선 순서대로 단일 스레드에서 수행 (재귀 대신 명시적 스택)
+    stack = [(root_str, 0, iter(listings.get(root_str, ())))]
+    while stack:
+        dir_path, depth, entries = stack[-1]
+        for name, kind in entries:
+            if kind:
+                item = os.path.join(dir_path, name)
+                stats["total_folders"] += 1
+
+                # 깊이 체크
+                if depth >= config.max_depth:
+                    stats["depth_issues"].append(item)
+
+                # 폴더 명명 규칙 체크
+                is_valid, _ = validate_folder_naming(name)
+                if not is_valid:
+                    stats["naming_issues"].append(f"폴더: {name}")
+
+                if item in listings:
+                    stack.append((item, depth + 1, iter(listings[item])))
+                    break
 
-                if item.is_dir():
-                    stats["total_folders"] += 1
-
-                    # 깊이 체크
-                    if depth >= config.max_depth:
-                        stats["depth_issues"].append(str(item))
-
-                    # 폴더 명명 규칙 체크
-                    is_valid, _ = validate_folder_naming(item.name)
-                    if not is_valid:
-                        stats["naming_issues"].append(f"폴더: {item.name}")
-
-                    scan_recursive(item, depth + 1)
-
-                elif item.is_file():
-                    stats["total_files"] += 1
-
-                    # 확장자 통계
-                    ext = item.suffix.lower() if item.suffix else "(없음)"
-                    stats["extensions"][ext] = stats["extensions"].get(ext, 0) + 1
-
-                    # 날짜 접두사 체크
-                    if not date_pattern.match(item.name):
-                        stats["files_without_date"].append(item.name)
+            else:
+                stats["total_files"] += 1
 
-        except PermissionError:
-            pass
+                # 확장자 통계
+                ext = split_extension(name)[1].lower() or "(없음)"
+                stats["extensions"][ext] += 1
 
-    scan_recursive(target)
+                # 날짜 접두사 체크
+                if not has_date_prefix(name):
+                    stats["files_without_date"].append(name)
+        else:
+            stack.pop()
 
     # 결과 포맷팅
     result_lines = [
@@ -429,8 +725,7 @@ def analyze_directory_structure(path: str) -> str:
     # 확장자별 분포
     if stats["extensions"]:
         result_lines.append("\n[EXTENSIONS] 확장자별 분포:")
-        sorted_exts = sorted(stats["extensions"].items(), key=lambda x: -x[1])
-        for ext, count in sorted_exts[:10]:
+        for ext, count in stats["extensions"].most_common(10):
             result_lines.append(f"   {ext}: {count}개")
 
     # 문제점
@@ -476,55 +771,109 @@ def analyze_directory_structure(path: str) -> str:
 # ============================================================================
 
 
-def move_file(source: str, destination: str) -> str:
+# Windows ERROR_NOT_SAME_DEVICE (다른 드라이브로 rename 시도)
+_WIN_ERROR_NOT_SAME_DEVICE = 17
+
+
+def _move_path(src: str, dest: str) -> None:
     """
-    파일을 이동합니다.
+    파일을 이동합니다. 같은 파일 시스템이면 os.rename 한 번으로 끝내고,
+    다른 파일 시스템(EXDEV)일 때만 shutil.move(복사 후 삭제)로 대체합니다.
+    대상이 존재하지 않는지는 호출하는 쪽에서 미리 확인해야 합니다.
+    """
+    try:
+        os.rename(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV and getattr(e, "winerror", None) != _WIN_ERROR_NOT_SAME_DEVICE:
+            raise
+        shutil.move(src, dest)
 
-    Args:
-        source: 원본 파일 경로
-        destination: 대상 경로 (파일명 포함 또는 디렉토리)
 
-    Returns:
-        작업 결과 메시지
+@dataclass
+class MoveValidation:
+    """move_file 검증 결과 (소스/대상 검증과 깊이 체크를 한 번에 수행한 결과)"""
+
+    src_path: str = ""
+    dest_path: str = ""
+    depth: int = 0
+    error_message: Optional[str] = None
+
+
+def _validate_move(source: str, destination: str) -> MoveValidation:
+    """
+    파일 이동에 필요한 검증을 한 번에 수행합니다.
+    대상 경로는 한 번만 stat하여 디렉토리 여부와 존재 여부를 함께 판단하므로
+    별도의 is_dir()/exists() 호출이 필요 없습니다.
     """
     # 소스 검증
     src_validation = validate_path(source, must_exist=True)
     if not src_validation.is_valid:
-        return f"[ERROR] 소스 오류: {src_validation.error_message}"
+        return MoveValidation(error_message=f"[ERROR] 소스 오류: {src_validation.error_message}")
 
-    src_path = src_validation.resolved_path
+    src_path = str(src_validation.resolved_path)
 
-    if not src_path.is_file():
-        return f"[ERROR] '{source}'는 파일이 아닙니다."
+    if not os.path.isfile(src_path):
+        return MoveValidation(error_message=f"[ERROR] '{source}'는 파일이 아닙니다.")
 
-    # 대상 검증
-    dest_path = Path(destination).resolve()
+    # 대상 검증 (Path 객체 없이 문자열로 처리)
+    dest_path = fast_resolve_str(destination)
+    try:
+        dest_mode = os.stat(dest_path).st_mode
+    except OSError:
+        dest_mode = None
 
     # 대상이 디렉토리면 파일명 유지
-    if dest_path.exists() and dest_path.is_dir():
-        dest_path = dest_path / src_path.name
+    if dest_mode is not None and stat.S_ISDIR(dest_mode):
+        dest_path = os.path.join(dest_path, os.path.basename(src_path))
+        dest_exists = os.path.exists(dest_path)
     else:
+        dest_exists = dest_mode is not None
         # 부모 디렉토리 존재 확인
-        dest_validation = validate_path(str(dest_path.parent), must_exist=True)
+        dest_validation = validate_path(os.path.dirname(dest_path), must_exist=True)
         if not dest_validation.is_valid:
-            return f"[ERROR] 대상 디렉토리 오류: {dest_validation.error_message}"
+            return MoveValidation(
+                error_message=f"[ERROR] 대상 디렉토리 오류: {dest_validation.error_message}"
+            )
 
     # 대상 경로 샌드박스 검증
-    dest_validation = validate_path(str(dest_path), must_exist=False)
+    dest_validation = validate_path(dest_path, must_exist=False)
     if not dest_validation.is_valid:
-        return f"[ERROR] 대상 오류: {dest_validation.error_message}"
+        return MoveValidation(error_message=f"[ERROR] 대상 오류: {dest_validation.error_message}")
 
     # 파일 존재 확인
-    if dest_path.exists():
-        return f"[ERROR] 대상에 이미 파일이 존재합니다: {dest_path}"
+    if dest_exists:
+        return MoveValidation(error_message=f"[ERROR] 대상에 이미 파일이 존재합니다: {dest_path}")
 
     # 깊이 체크
-    depth_ok, current_depth = check_directory_depth(dest_path.parent)
+    depth_ok, current_depth = check_directory_depth(os.path.dirname(dest_path))
     if not depth_ok:
-        return f"[WARNING] 대상 경로가 최대 깊이({config.max_depth})를 초과합니다. (현재: {current_depth})"
+        return MoveValidation(
+            error_message=f"[WARNING] 대상 경로가 최대 깊이({config.max_depth})를 초과합니다. (현재: {current_depth})"
+        )
+
+    return MoveValidation(src_path=src_path, dest_path=dest_path, depth=current_depth)
+
+
+@_serialized
+def move_file(source: str, destination: str) -> str:
+    """
+    파일을 이동합니다.
+
+    Args:
+        source: 원본 파일 경로
+        destination: 대상 경로 (파일명 포함 또는 디렉토리)
+
+    Returns:
+        작업 결과 메시지
+    """
+    move = _validate_move(source, destination)
+    if move.error_message:
+        return move.error_message
+
+    src_path, dest_path = move.src_path, move.dest_path
 
     # Dry Run 체크
-    if config.dry_run:
+    if _is_dry_run():
         return (
             f"[DRY RUN] 파일 이동 시뮬레이션:\n"
             f"   원본: {src_path}\n"
@@ -534,7 +883,8 @@ def move_file(source: str, destination: str) -> str:
 
     # 실제 이동
     try:
-        shutil.move(str(src_path), str(dest_path))
+        _move_path(src_path, dest_path)
+        notify_fs_changed()
         return (
             f"[OK] 파일 이동 완료:\n" f"   원본: {src_path}\n" f"   대상: {dest_path}"
         )
@@ -544,6 +894,16 @@ def move_file(source: str, destination: str) -> str:
         return f"[ERROR] 이동 오류: {str(e)}"
 
 
+# 이름에 포함될 수 없는 경로 구분자
+_PATH_SEPS = frozenset("/\\")
+
+# 목록 미리보기 줄 템플릿 (변경 계획/검색 결과 dict에 format_map으로 적용)
+_RENAME_PREVIEW_LINE = "   • {old}\n     → {new}"
+_RENAME_CONFLICT_LINE = "   • {old} → {new} (이미 존재)"
+_FOUND_FILE_LINE = "   • {name} ({extension})"
+
+
+@_serialized
 def rename_file(path: str, new_name: str) -> str:
     """
     파일 또는 폴더의 이름을 변경합니다.
@@ -559,17 +919,23 @@ def rename_file(path: str, new_name: str) -> str:
     if not validation.is_valid:
         return f"[ERROR] {validation.error_message}"
 
-    target = validation.resolved_path
+    return _rename_resolved(validation.resolved_path, new_name)
+
 
+def _rename_resolved(target: Path, new_name: str) -> str:
+    """
+    이미 검증된 경로(target)의 이름을 변경합니다. (rename_file의 실제 로직)
+    호출하는 쪽에서 target을 validate_path로 검증한 경우 재검증 없이 사용합니다.
+    """
     # 새 이름 검증
     new_name = sanitize_filename(new_name)
-    if "/" in new_name or "\\" in new_name:
+    if not _PATH_SEPS.isdisjoint(new_name):
         return f"[ERROR] 새 이름에는 경로 구분자를 포함할 수 없습니다."
 
     new_path = target.parent / new_name
 
     # 새 경로 검증
-    new_validation = validate_path(str(new_path), must_exist=False)
+    new_validation = validate_path(new_path, must_exist=False)
     if not new_validation.is_valid:
         return f"[ERROR] 대상 오류: {new_validation.error_message}"
 
@@ -585,7 +951,7 @@ def rename_file(path: str, new_name: str) -> str:
         naming_msg = ""
 
     # Dry Run 체크
-    if config.dry_run:
+    if _is_dry_run():
         item_type = "폴더" if target.is_dir() else "파일"
         return (
             f"[DRY RUN] {item_type} 이름 변경 시뮬레이션:\n"
@@ -598,6 +964,7 @@ def rename_file(path: str, new_name: str) -> str:
     # 실제 이름 변경
     try:
         target.rename(new_path)
+        notify_fs_changed()
         item_type = "폴더" if new_path.is_dir() else "파일"
         return (
             f"[OK] {item_type} 이름 변경 완료:\n"
@@ -610,6 +977,7 @@ def rename_file(path: str, new_name: str) -> str:
         return f"[ERROR] 이름 변경 오류: {str(e)}"
 
 
+@_serialized
 def create_folder(path: str, name: str = None) -> str:
     """
     새 폴더를 생성합니다.
@@ -621,25 +989,20 @@ def create_folder(path: str, name: str = None) -> str:
     Returns:
         작업 결과 메시지
     """
-    if name:
-        folder_path = Path(path) / name
-    else:
-        folder_path = Path(path)
-
-    folder_path = folder_path.resolve()
+    folder_path = fast_resolve_str(os.path.join(path, name) if name else path)
 
     # 부모 디렉토리 검증
-    parent_validation = validate_path(str(folder_path.parent), must_exist=True)
+    parent_validation = validate_path(os.path.dirname(folder_path), must_exist=True)
     if not parent_validation.is_valid:
         return f"[ERROR] 부모 디렉토리 오류: {parent_validation.error_message}"
 
     # 새 경로 검증
-    folder_validation = validate_path(str(folder_path), must_exist=False)
+    folder_validation = validate_path(folder_path, must_exist=False)
     if not folder_validation.is_valid:
         return f"[ERROR] 경로 오류: {folder_validation.error_message}"
 
     # 이미 존재하는지 확인
-    if folder_path.exists():
+    if os.path.exists(folder_path):
         return f"[ERROR] '{folder_path}'이(가) 이미 존재합니다."
 
     # 깊이 체크
@@ -648,12 +1011,12 @@ def create_folder(path: str, name: str = None) -> str:
         return f"[ERROR] 최대 디렉토리 깊이({config.max_depth})를 초과합니다. (결과 깊이: {current_depth})"
 
     # 명명 규칙 확인
-    folder_name = folder_path.name
+    folder_name = os.path.basename(folder_path)
     is_valid, warning = validate_folder_naming(folder_name)
     naming_msg = "" if is_valid else f"\n[WARNING] 명명 규칙 경고: {warning}"
 
     # Dry Run 체크
-    if config.dry_run:
+    if _is_dry_run():
         return (
             f"[DRY RUN] 폴더 생성 시뮬레이션:\n"
             f"   경로: {folder_path}\n"
@@ -663,7 +1026,8 @@ def create_folder(path: str, name: str = None) -> str:
 
     # 실제 폴더 생성
     try:
-        folder_path.mkdir(parents=False, exist_ok=False)
+        os.mkdir(folder_path)
+        notify_fs_changed()
         return (
             f"[OK] 폴더 생성 완료:\n"
             f"   경로: {folder_path}\n"
@@ -677,19 +1041,22 @@ def create_folder(path: str, name: str = None) -> str:
         return f"[ERROR] 폴더 생성 오류: {str(e)}"
 
 
-def batch_rename_with_date(directory: str, use_modified: bool = True) -> str:
+def batch_rename_with_date(
+    directory: str,
+    use_modified: bool = True,
+    progress: Optional[JobProgress] = None,
+) -> str:
     """
     디렉토리 내 모든 파일에 YYMMDD 날짜 접두사를 추가합니다.
 
     Args:
         directory: 대상 디렉토리 경로
         use_modified: True면 수정일, False면 생성일 사용
+        progress: 진행 상황 카운터 (백그라운드 작업용, 선택적)
 
     Returns:
         작업 결과 (또는 Dry Run 시뮬레이션)
     """
-    import re
-
     validation = validate_path(directory, must_exist=True)
     if not validation.is_valid:
         return f"[ERROR] {validation.error_message}"
@@ -699,61 +1066,109 @@ def batch_rename_with_date(directory: str, use_modified: bool = True) -> str:
     if not target.is_dir():
         return f"[ERROR] '{directory}'는 디렉토리가 아닙니다."
 
-    date_pattern = re.compile(r"^\d{6}_")
     changes = []
+    parent_str = str(target)
+    # 대상 폴더의 기존 이름 (충돌 검사용, 숨김 파일 포함)
+    existing_names = set()
 
     try:
-        for item in target.iterdir():
-            if not item.is_file():
-                continue
-            if item.name.startswith("."):
-                continue
+        with os.scandir(target) as it:
+            for entry in it:
+                name = entry.name
+                existing_names.add(name)
+                if name.startswith("."):
+                    continue
+                if not entry.is_file():
+                    continue
 
-            # 이미 날짜 접두사가 있는 파일은 건너뜀
-            if date_pattern.match(item.name):
-                continue
+                # 이미 날짜 접두사가 있는 파일은 건너뜀
+                if has_date_prefix(name):
+                    continue
 
-            dates = get_file_dates(item)
-            date_str = dates["modified_str"] if use_modified else dates["created_str"]
-            new_name = f"{date_str}_{item.name}"
+                dates = get_file_dates(entry)
+                date_str = dates["modified_str"] if use_modified else dates["created_str"]
+                new_name = f"{date_str}_{name}"
 
-            changes.append({"old": item.name, "new": new_name, "path": item})
+                changes.append({
+                    "old": name,
+                    "new": new_name,
+                    "old_path": entry.path,
+                    "new_path": os.path.join(parent_str, new_name),
+                })
     except PermissionError:
         return f"[ERROR] 권한 오류: 디렉토리에 접근할 수 없습니다."
 
-    if not changes:
+    # 이미 존재하는 이름으로 바뀌는 파일은 덮어쓰지 않도록 계획에서 제외
+    conflicts = [c for c in changes if c["new"] in existing_names]
+    if conflicts:
+        changes = [c for c in changes if c["new"] not in existing_names]
+
+    if not changes and not conflicts:
         return "[INFO] 이름을 변경할 파일이 없습니다. (모든 파일에 이미 날짜 접두사가 있음)"
 
     date_type = "수정일" if use_modified else "생성일"
 
-    if config.dry_run:
+    if _is_dry_run():
         result_lines = [
             f"[DRY RUN] 일괄 날짜 접두사 추가 시뮬레이션 ({date_type} 기준):",
             f"   대상 디렉토리: {target}",
             f"   변경 예정 파일: {len(changes)}개",
             "",
         ]
-        for change in changes[:10]:
-            result_lines.append(f"   • {change['old']}")
-            result_lines.append(f"     → {change['new']}")
+        result_lines.extend(_RENAME_PREVIEW_LINE.format_map(change) for change in changes[:10])
 
         if len(changes) > 10:
             result_lines.append(f"   ... 외 {len(changes) - 10}개 파일")
 
+        if conflicts:
+            result_lines.append(f"\n[WARNING] 이름 충돌로 건너뛸 파일: {len(conflicts)}개")
+            result_lines.extend(_RENAME_CONFLICT_LINE.format_map(change) for change in conflicts[:5])
+
         result_lines.append("\n[OK] 실제로 변경하려면 dry_run을 비활성화하세요.")
         return "\n".join(result_lines)
 
-    # 실제 이름 변경
-    success = 0
-    errors = []
-
-    for change in changes:
+    # 계획은 잠금 없이 세우고, 실제 이름 변경 구간에서만 _MUTATION_LOCK을 잡음
+    if not _acquire_mutation_lock():
+        return _MUTATION_BUSY_MESSAGE
+    try:
+        # 계획 이후 다른 도구가 폴더를 바꿨을 수 있으므로 잠금을 잡은 뒤 충돌을 다시 검사
         try:
-            new_path = change["path"].parent / change["new"]
-            change["path"].rename(new_path)
-            success += 1
-        except Exception as e:
-            errors.append(f"{change['old']}: {str(e)}")
+            current_names = set(os.listdir(target))
+        except OSError as e:
+            return f"[ERROR] 디렉토리를 다시 읽을 수 없습니다: {str(e)}"
+        errors = [f"{c['old']}: 대상 이름 '{c['new']}'이(가) 이미 존재합니다." for c in conflicts]
+        planned = []
+        for change in changes:
+            if change["old"] not in current_names:
+                errors.append(f"{change['old']}: 원본 파일이 더 이상 존재하지 않습니다.")
+            elif change["new"] in current_names:
+                errors.append(f"{change['old']}: 대상 이름 '{change['new']}'이(가) 이미 존재합니다.")
+            else:
+                planned.append(change)
+
+        # 실제 이름 변경 (계획이 충돌 없이 확정되었으므로 병렬로 수행)
+        success = 0
+        if progress is not None:
+            progress.total = len(planned)
+
+        def rename_one(change: dict) -> None:
+            os.rename(change["old_path"], change["new_path"])
+
+        if planned:
+            workers = max(1, min(config.rename_workers, len(planned)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(rename_one, change): change for change in planned}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        success += 1
+                    except Exception as e:
+                        errors.append(f"{futures[future]['old']}: {str(e)}")
+                    if progress is not None:
+                        progress.done += 1
+        notify_fs_changed()
+    finally:
+        _MUTATION_LOCK.release()
 
     result_lines = [
         f"[OK] 일괄 날짜 접두사 추가 완료 ({date_type} 기준):",
@@ -763,8 +1178,7 @@ def batch_rename_with_date(directory: str, use_modified: bool = True) -> str:
 
     if errors:
         result_lines.append("\n[ERROR] 오류 목록:")
-        for error in errors[:5]:
-            result_lines.append(f"   • {error}")
+        result_lines.extend(f"   • {error}" for error in errors[:5])
 
     return "\n".join(result_lines)
 
@@ -794,29 +1208,19 @@ def suggest_filename_from_content(path: str, max_content_length: int = 1000) ->
 
     target = validation.resolved_path
 
-    if not target.is_file():
+    # 한 번의 stat으로 파일 여부, 크기, 날짜를 함께 확인
+    try:
+        st, dates = stat_and_dates(target)
+    except OSError as e:
+        return f"[ERROR] 파일 읽기 오류: {str(e)}"
+
+    if not stat.S_ISREG(st.st_mode):
         return f"[ERROR] '{path}'는 파일이 아닙니다."
 
     ext = target.suffix.lower()
-    readable_exts = get_readable_extensions()
-
-    if ext not in readable_exts:
-        return f"[ERROR] '{ext}' 확장자는 내용을 분석할 수 없습니다. 지원 확장자: {', '.join(sorted(readable_exts))}"
-
-    # 파일 정보 수집
-    dates = get_file_dates(target)
-    size = get_file_size_str(target.stat().st_size)
-    is_meaningless = is_meaningless_filename(target.name)
 
-    result_lines = [
-        f"[ANALYZE] 파일 분석: {target.name}",
-        f"   경로: {target}",
-        f"   확장자: {ext}",
-        f"   크기: {size}",
-        f"   수정일: {dates['modified_iso']}",
-        f"   의미를 알 수 없는 파일명 여부: {'예 (이름 변경 권장)' if is_meaningless else '아니오'}",
-        "",
-    ]
+    if ext not in _READABLE_EXTS:
+        return f"[ERROR] '{ext}' 확장자는 내용을 분석할 수 없습니다. 지원 확장자: {', '.join(sorted(_READABLE_EXTS))}"
 
     # 파일 내용 읽기
     content = ""
@@ -833,18 +1237,47 @@ def suggest_filename_from_content(path: str, max_content_length: int = 1000) ->
             return content  # 에러 메시지 반환
         encoding_info = "pdf"
     else:
-        # 일반 텍스트 파일
-        if is_binary_file(target):
-            return f"[ERROR] '{target.name}'은 바이너리 파일입니다. 내용을 분석할 수 없습니다."
-
+        # 일반 텍스트 파일: 한 번 열어 fstat과 앞부분 읽기를 함께 수행하고,
+        # 바이너리 판별과 디코딩은 읽은 바이트로 메모리에서 처리
+        read_size = max_content_length * 4
         try:
-            content, encoding_info = read_file_with_encoding(target, max_content_length)
+            raw, _ = read_file_head(target, max(read_size, BINARY_SNIFF_BYTES))
         except Exception as e:
             return f"[ERROR] 파일 읽기 오류: {str(e)}"
 
+        if is_binary_bytes(raw):
+            return f"[ERROR] '{target.name}'은 바이너리 파일입니다. 내용을 분석할 수 없습니다."
+
+        content, encoding_info = decode_text_bytes(
+            raw[:read_size], max_content_length, is_complete=len(raw) < read_size
+        )
+
+    # 파일 정보 (위에서 얻은 stat 결과로 날짜와 크기 모두 계산)
+    size = get_file_size_str(st.st_size)
+    is_meaningless = is_meaningless_filename(target.name)
+
+    result_lines = [
+        f"[ANALYZE] 파일 분석: {target.name}",
+        f"   경로: {target}",
+        f"   확장자: {ext}",
+        f"   크기: {size}",
+        f"   수정일: {dates['modified_iso']}",
+        f"   의미를 알 수 없는 파일명 여부: {'예 (이름 변경 권장)' if is_meaningless else '아니오'}",
+        "",
+    ]
+
     # 내용이 비어있는 경우
     if not content.strip():
         result_lines.append("[WARNING] 파일 내용이 비어있습니다.")
+        # 텍스트가 없는 PDF(스캔 문서 등)는 본문 대신 문서 정보를 참고할 수 있도록 표시
+        if ext == ".pdf":
+            pdf_info = read_pdf_metadata(target)
+            if pdf_info:
+                result_lines.append(f"   페이지 수: {pdf_info['pages']}")
+                if pdf_info['title']:
+                    result_lines.append(f"   문서 제목: {pdf_info['title']}")
+                if pdf_info['author']:
+                    result_lines.append(f"   작성자: {pdf_info['author']}")
         return "\n".join(result_lines)
 
     result_lines.extend([
@@ -883,44 +1316,59 @@ def get_image_for_analysis(path: str, max_size: int = 512):
 
     target = validation.resolved_path
 
-    if not target.is_file():
+    # 한 번의 stat으로 파일 여부, 크기, 날짜를 함께 확인
+    try:
+        st, dates = stat_and_dates(target)
+    except OSError as e:
+        return f"[ERROR] 이미지 처리 오류: {str(e)}"
+
+    if not stat.S_ISREG(st.st_mode):
         return f"[ERROR] '{path}'는 파일이 아닙니다."
 
     ext = target.suffix.lower()
-    image_exts = get_image_extensions()
 
-    if ext not in image_exts:
-        return f"[ERROR] '{ext}' 확장자는 이미지가 아닙니다. 지원 확장자: {', '.join(sorted(image_exts))}"
+    if ext not in _IMAGE_EXTS:
+        return f"[ERROR] '{ext}' 확장자는 이미지가 아닙니다. 지원 확장자: {', '.join(sorted(_IMAGE_EXTS))}"
 
     # 이미지 정보 수집
-    dates = get_file_dates(target)
-    size = get_file_size_str(target.stat().st_size)
+    size = get_file_size_str(st.st_size)
     is_meaningless = is_meaningless_filename(target.name)
 
+    # 같은 이미지를 다시 분석하는 경우 리사이즈 결과 재사용 (디코딩 생략)
+    cached = get_cached_image(target, st.st_mtime_ns, max_size)
+
     # 이미지 리사이즈가 필요한 경우 처리
+    PILImage = pil_image_module()
     try:
-        if PIL_AVAILABLE:
+        if cached is not None:
+            mcp_image = MCPImage(data=cached[0], format=cached[1])
+        elif PILImage is not None:
             from io import BytesIO
-            with PILImage.open(target) as img:
+            source = open_for_parsing(target, st.st_size)
+            with PILImage.open(source) as img:
                 # 리사이즈 필요 여부 확인
                 if max(img.size) > max_size:
-                    ratio = max_size / max(img.size)
-                    new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
-                    img_resized = img.resize(new_size, PILImage.Resampling.LANCZOS)
-                    
-                    # RGBA를 RGB로 변환 (JPEG 저장을 위해)
-                    if img_resized.mode == 'RGBA':
-                        img_resized = img_resized.convert('RGB')
+                    # JPEG는 DCT 축소 디코딩으로 전체 해상도 디코딩을 생략
+                    img.draft('RGB', (max_size, max_size))
+                    img.thumbnail((max_size, max_size), PILImage.Resampling.LANCZOS)
+
+                    # 8비트 RGB로 변환 (RGBA/CMYK/16비트 이미지 등)
+                    save_format = 'JPEG' if ext in ['.jpg', '.jpeg'] else 'PNG'
+                    keep_modes = ('RGB', 'L') if save_format == 'JPEG' else ('RGB', 'L', 'P')
+                    img_resized = img if img.mode in keep_modes else img.convert('RGB')
                     
                     # 바이트로 저장
                     buffer = BytesIO()
-                    save_format = 'JPEG' if ext in ['.jpg', '.jpeg'] else 'PNG'
-                    img_resized.save(buffer, format=save_format, quality=85)
+                    img_resized.save(buffer, format=save_format, quality=80)
                     image_bytes = buffer.getvalue()
                     
                     # format 결정
                     img_format = 'jpeg' if save_format == 'JPEG' else 'png'
+                    put_cached_image(target, st.st_mtime_ns, max_size, image_bytes, img_format)
                     mcp_image = MCPImage(data=image_bytes, format=img_format)
+                elif isinstance(source, BytesIO) and img.format in ('JPEG', 'PNG', 'GIF', 'WEBP', 'BMP'):
+                    # 리사이즈 불필요 - 이미 메모리에 읽은 원본 바이트를 그대로 사용 (파일 재읽기 생략)
+                    mcp_image = MCPImage(data=source.getvalue(), format=img.format.lower())
                 else:
                     # 리사이즈 불필요 - 파일 경로 직접 사용
                     mcp_image = MCPImage(path=str(target))
@@ -949,6 +1397,8 @@ def get_image_for_analysis(path: str, max_size: int = 512):
     return [mcp_image, metadata_text]
 
 
+# 파일별 수정일로 그룹을 나누므로 디렉토리 mtime 기준 캐시(cached_by_mtime)는 적용하지 않음
+# (파일 내용만 수정하면 디렉토리 mtime은 바뀌지 않아 오래된 결과가 반환됨)
 def analyze_file_relationships(directory: str) -> str:
     """
     디렉토리 내 파일들의 관계를 분석하여 그룹핑 제안을 위한 정보를 반환합니다.
@@ -969,38 +1419,36 @@ def analyze_file_relationships(directory: str) -> str:
     if not target.is_dir():
         return f"[ERROR] '{directory}'는 디렉토리가 아닙니다."
 
+    # 한 번의 scandir 순회에서 파일명 수집, 의미 없는 파일명 판별, 날짜별 그룹핑을 함께 수행
+    # (숨김 파일 제외, 파일 여부는 DirEntry의 캐시된 타입 정보 사용)
+    filenames = []
+    meaningless_files = []
+    date_groups = defaultdict(list)
     try:
-        items = list(target.iterdir())
+        with os.scandir(target) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(".") or not entry.is_file():
+                    continue
+                filenames.append(name)
+
+                if is_meaningless_filename(name):
+                    meaningless_files.append(name)
+
+                date_key = get_file_dates(entry)["modified_str"]  # YYMMDD
+                date_groups[date_key].append(name)
     except PermissionError:
         return f"[ERROR] 권한 오류: '{directory}'에 접근할 수 없습니다."
 
-    # 파일만 필터링 (숨김 파일 제외)
-    files = [
-        item for item in items if item.is_file() and not item.name.startswith(".")
-    ]
-
-    if not files:
+    if not filenames:
         return f"[INFO] '{directory}'에 분석할 파일이 없습니다."
 
-    # 파일명 패턴 분석
-    filenames = [f.name for f in files]
+    # 파일명 패턴 분석 (확장자/접두사/키워드 그룹)
     patterns = analyze_filename_patterns(filenames)
 
-    # 의미를 알 수 없는 파일명 파일 찾기
-    meaningless_files = [f.name for f in files if is_meaningless_filename(f.name)]
-
-    # 파일 정보 수집 (날짜별 그룹핑용)
-    date_groups = {}
-    for f in files:
-        dates = get_file_dates(f)
-        date_key = dates["modified_str"]  # YYMMDD
-        if date_key not in date_groups:
-            date_groups[date_key] = []
-        date_groups[date_key].append(f.name)
-
     result_lines = [
         f"[ANALYSIS] 파일 관계 분석: {target}",
-        f"   총 파일 수: {len(files)}개",
+        f"   총 파일 수: {len(filenames)}개",
         "",
     ]
 
@@ -1018,7 +1466,7 @@ def analyze_file_relationships(directory: str) -> str:
     if patterns["common_prefixes"]:
         result_lines.append("[PREFIX_GROUPS] 공통 접두사:")
         for prefix in patterns["common_prefixes"][:10]:
-            matching = [f for f in filenames if f.startswith(prefix + "_") or f.startswith(prefix + "-")]
+            matching = patterns["prefix_groups"][prefix]
             if matching:
                 result_lines.append(f"   '{prefix}_': {', '.join(matching[:3])}")
                 if len(matching) > 3:
@@ -1060,6 +1508,7 @@ def analyze_file_relationships(directory: str) -> str:
     return "\n".join(result_lines)
 
 
+@_serialized
 def rename_with_suggestion(path: str, suggested_name: str, keep_extension: bool = True) -> str:
     """
     LLM이 제안한 이름으로 파일명을 변경합니다.
@@ -1086,13 +1535,14 @@ def rename_with_suggestion(path: str, suggested_name: str, keep_extension: bool
 
     # 확장자 처리
     if keep_extension:
-        new_stem = Path(new_name).stem
-        new_name = f"{new_stem}{target.suffix}"
+        new_stem = split_extension(new_name)[0]
+        new_name = f"{new_stem}{split_extension(target.name)[1]}"
 
-    # 기존 rename_file 로직 재사용
-    return rename_file(str(target), new_name)
+    # 기존 rename_file 로직 재사용 (target은 이미 검증됨)
+    return _rename_resolved(target, new_name)
 
 
+@_serialized
 def group_files_into_folder(
     directory: str, folder_name: str, file_names: list
 ) -> str:
@@ -1127,14 +1577,21 @@ def group_files_into_folder(
 
     new_folder_path = target_dir / folder_name
 
-    # 이동할 파일 확인
+    # 이동할 파일 확인 (scandir 한 번으로 이름 -> DirEntry 맵을 만들어 파일마다 stat하지 않음)
+    # 맵에는 target_dir 바로 아래 항목만 있으므로 하위/상위 경로가 포함된 이름은 누락으로 처리됨
+    try:
+        with os.scandir(target_dir) as it:
+            entries_by_name = {entry.name: entry for entry in it}
+    except PermissionError:
+        return f"[ERROR] 권한 오류: '{directory}'에 접근할 수 없습니다."
+
     files_to_move = []
     missing_files = []
 
     for fname in file_names:
-        file_path = target_dir / fname
-        if file_path.exists() and file_path.is_file():
-            files_to_move.append(file_path)
+        entry = entries_by_name.get(fname)
+        if entry is not None and entry.is_file():
+            files_to_move.append(Path(entry.path))
         else:
             missing_files.append(fname)
 
@@ -1147,15 +1604,14 @@ def group_files_into_folder(
         return f"[ERROR] 최대 디렉토리 깊이({config.max_depth})를 초과합니다. (결과 깊이: {current_depth})"
 
     # Dry Run 체크
-    if config.dry_run:
+    if _is_dry_run():
         result_lines = [
             f"[DRY RUN] 파일 그룹핑 시뮬레이션:",
             f"   새 폴더: {new_folder_path}{naming_msg}",
             f"   이동 예정 파일: {len(files_to_move)}개",
         ]
 
-        for f in files_to_move[:5]:
-            result_lines.append(f"   • {f.name}")
+        result_lines.extend(f"   • {f.name}" for f in files_to_move[:5])
         if len(files_to_move) > 5:
             result_lines.append(f"   ... 외 {len(files_to_move) - 5}개")
 
@@ -1171,20 +1627,34 @@ def group_files_into_folder(
         if not new_folder_path.exists():
             new_folder_path.mkdir(parents=False, exist_ok=False)
 
-        # 파일 이동
+        # 파일 이동 (대상 이름 충돌은 미리 걸러내고 나머지는 병렬로 이동)
         success = 0
         errors = []
+        planned = []
+        planned_names = set()
 
         for file_path in files_to_move:
-            try:
-                dest_path = new_folder_path / file_path.name
-                if dest_path.exists():
-                    errors.append(f"{file_path.name}: 대상에 이미 파일 존재")
-                    continue
-                shutil.move(str(file_path), str(dest_path))
-                success += 1
-            except Exception as e:
-                errors.append(f"{file_path.name}: {str(e)}")
+            dest_path = new_folder_path / file_path.name
+            if file_path.name in planned_names or dest_path.exists():
+                errors.append(f"{file_path.name}: 대상에 이미 파일 존재")
+                continue
+            planned_names.add(file_path.name)
+            planned.append((file_path, dest_path))
+
+        def move_one(src: Path, dest: Path) -> None:
+            _move_path(str(src), str(dest))
+
+        if planned:
+            workers = max(1, min(config.rename_workers, len(planned)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(move_one, src, dest): src for src, dest in planned}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        success += 1
+                    except Exception as e:
+                        errors.append(f"{futures[future].name}: {str(e)}")
+        notify_fs_changed()
 
         result_lines = [
             f"[OK] 파일 그룹핑 완료:{naming_msg}",
@@ -1195,8 +1665,7 @@ def group_files_into_folder(
 
         if errors:
             result_lines.append("\n[ERROR] 오류 목록:")
-            for error in errors[:5]:
-                result_lines.append(f"   • {error}")
+            result_lines.extend(f"   • {error}" for error in errors[:5])
 
         if missing_files:
             result_lines.append(f"\n[WARNING] 찾을 수 없었던 파일: {', '.join(missing_files[:5])}")
@@ -1211,6 +1680,7 @@ def group_files_into_folder(
         return f"[ERROR] 작업 오류: {str(e)}"
 
 
+@cached_by_mtime
 def find_files_needing_rename(directory: str) -> str:
     """
     디렉토리 내에서 이름 변경이 필요한 파일들(의미를 알 수 없는 파일명)을 찾아 목록을 반환합니다.
@@ -1227,64 +1697,57 @@ def find_files_needing_rename(directory: str) -> str:
 
     target = validation.resolved_path
 
-    if not target.is_dir():
+    # 디렉토리 확인에 쓴 stat의 st_size를 scandir_large에 넘겨 stat을 반복하지 않음
+    try:
+        dir_stat = os.stat(target)
+    except OSError as e:
+        return f"[ERROR] 디렉토리 정보를 읽을 수 없습니다: {str(e)}"
+    if not stat.S_ISDIR(dir_stat.st_mode):
         return f"[ERROR] '{directory}'는 디렉토리가 아닙니다."
 
+    # 의미를 알 수 없는 파일명을 가진 파일 찾기
+    # (scandir 항목을 바로 걸러 전체 목록을 만들지 않고, 파일 여부는 캐시된 타입 정보로 확인)
+    # 개수는 모두 세지만 출력에 쓰이는 타입별 앞 10개만 보관
+    preview_limit = 10
+    found = {"text": [], "image": []}
+    counts = {"text": 0, "image": 0}
+    # (항목이 매우 많은 디렉토리는 scandir_large가 큰 버퍼로 열거)
     try:
-        items = list(target.iterdir())
+        for entry in scandir_large(target, dir_stat.st_size):
+            name = entry.name
+            if name.startswith(".") or not is_meaningless_filename(name):
+                continue
+            ext = split_extension(name)[1].lower()
+            if ext not in _ANALYZABLE_EXTS or not entry.is_file():
+                continue
+            file_type = "image" if ext in _IMAGE_EXTS else "text"
+            counts[file_type] += 1
+            if counts[file_type] <= preview_limit:
+                found[file_type].append({"name": name, "extension": ext})
     except PermissionError:
         return f"[ERROR] 권한 오류: '{directory}'에 접근할 수 없습니다."
 
-    # 파일만 필터링
-    files = [
-        item for item in items if item.is_file() and not item.name.startswith(".")
-    ]
-
-    # 분석 가능한 파일 확장자
-    readable_exts = get_readable_extensions()
-    image_exts = get_image_extensions()
-    analyzable_exts = readable_exts | image_exts
-
-    # 의미를 알 수 없는 파일명을 가진 파일 찾기
-    meaningless_files = []
-    for f in files:
-        if is_meaningless_filename(f.name):
-            ext = f.suffix.lower()
-            if ext in analyzable_exts:
-                file_type = "image" if ext in image_exts else "text"
-                meaningless_files.append({
-                    "name": f.name,
-                    "path": str(f),
-                    "type": file_type,
-                    "extension": ext,
-                })
-
-    if not meaningless_files:
+    total = counts["text"] + counts["image"]
+    if not total:
         return f"[OK] '{directory}'에 이름 변경이 필요한 분석 가능 파일이 없습니다."
 
     result_lines = [
-        f"[FOUND] 이름 변경이 필요한 파일 ({len(meaningless_files)}개):",
+        f"[FOUND] 이름 변경이 필요한 파일 ({total}개):",
         "",
     ]
 
-    # 타입별 분리
-    text_files = [f for f in meaningless_files if f["type"] == "text"]
-    image_files = [f for f in meaningless_files if f["type"] == "image"]
-
-    if text_files:
+    if counts["text"]:
         result_lines.append("[TEXT] 텍스트/문서 파일 (suggest_filename_from_content 사용):")
-        for f in text_files[:10]:
-            result_lines.append(f"   • {f['name']} ({f['extension']})")
-        if len(text_files) > 10:
-            result_lines.append(f"   ... 외 {len(text_files) - 10}개")
+        result_lines.extend(_FOUND_FILE_LINE.format_map(f) for f in found["text"])
+        if counts["text"] > preview_limit:
+            result_lines.append(f"   ... 외 {counts['text'] - preview_limit}개")
         result_lines.append("")
 
-    if image_files:
+    if counts["image"]:
         result_lines.append("[IMAGE] 이미지 파일 (get_image_for_analysis 사용):")
-        for f in image_files[:10]:
-            result_lines.append(f"   • {f['name']} ({f['extension']})")
-        if len(image_files) > 10:
-            result_lines.append(f"   ... 외 {len(image_files) - 10}개")
+        result_lines.extend(_FOUND_FILE_LINE.format_map(f) for f in found["image"])
+        if counts["image"] > preview_limit:
+            result_lines.append(f"   ... 외 {counts['image'] - preview_limit}개")
         result_lines.append("")
 
     result_lines.extend([
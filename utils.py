@@ -5,29 +5,90 @@ utils.py - 파일 정리 MCP 서버용 유틸리티 함수
 
 import os
 import re
+import codecs
+import json
+import time
+import struct
+import sqlite3
+import stat
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple, Union
 from dataclasses import dataclass
 import base64
+import sys
 from io import BytesIO
 
-# Optional: python-docx for .docx files
+# Optional: python-docx(.docx), PyPDF2/PyMuPDF(.pdf), Pillow(이미지)는
+# 경로 검증 등 대부분의 호출에서 필요 없으므로 처음 사용할 때 불러옵니다. (아래 _get_* 함수 참고)
+
+# Optional: cchardet for fast encoding detection (C 구현, charset-normalizer보다 우선 사용)
 try:
-    from docx import Document as DocxDocument
-    DOCX_AVAILABLE = True
+    import cchardet
+    CCHARDET_AVAILABLE = True
 except ImportError:
-    DOCX_AVAILABLE = False
+    CCHARDET_AVAILABLE = False
 
-# Optional: PyPDF2 for .pdf files
+# Optional: charset-normalizer for encoding detection
 try:
-    from PyPDF2 import PdfReader
-    PDF_AVAILABLE = True
+    from charset_normalizer import from_bytes as detect_charset
+    CHARSET_DETECTION_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    CHARSET_DETECTION_AVAILABLE = False
+
+
+@lru_cache(maxsize=1)
+def _get_docx_document():
+    """python-docx의 Document 클래스를 처음 필요할 때 불러옵니다. 설치되지 않았으면 None."""
+    try:
+        from docx import Document
+    except ImportError:
+        return None
+    return Document
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _get_pdf_reader():
+    """PyPDF2의 PdfReader 클래스를 처음 필요할 때 불러옵니다. 설치되지 않았으면 None."""
+    try:
+        from PyPDF2 import PdfReader
+    except ImportError:
+        return None
+    return PdfReader
+
+
+@lru_cache(maxsize=1)
+def _get_fitz():
+    """PyMuPDF(fitz) 모듈을 처음 필요할 때 불러옵니다. 설치되지 않았으면 None."""
+    try:
+        import fitz
+    except ImportError:
+        return None
+    return fitz
+
+
+@lru_cache(maxsize=1)
+def _get_pil_image():
+    """Pillow의 PIL.Image 모듈을 처음 필요할 때 불러옵니다. 설치되지 않았으면 None."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def pil_image_module():
+    """이미지 도구에서 사용할 PIL.Image 모듈을 반환합니다. (Pillow가 없으면 None)"""
+    return _get_pil_image()
+
+
+@dataclass(frozen=True)
 class PathValidationResult:
     """경로 검증 결과를 담는 데이터 클래스"""
     is_valid: bool
@@ -59,16 +120,61 @@ FORBIDDEN_DRIVE_PATHS = [
     r"C:\\ProgramData",
 ]
 
+# 금지 경로를 한 번의 search로 확인하는 정규식 (호출마다 목록을 순회하지 않도록)
+_FORBIDDEN_DRIVE_BY_LC = {p.lower(): p for p in FORBIDDEN_DRIVE_PATHS}
+_RE_FORBIDDEN_DRIVE = re.compile(
+    '|'.join(re.escape(p) for p in _FORBIDDEN_DRIVE_BY_LC)
+)
+_PATH_SEP_CLASS = '[' + re.escape(os.sep + (os.altsep or '')) + ']'
+# 경로 구성 요소 전체가 금지 폴더 이름과 일치하는 경우만 (앞뒤가 구분자 또는 문자열 끝)
+_RE_FORBIDDEN_PART = re.compile(
+    f'(?:^|(?<={_PATH_SEP_CLASS}))'
+    f'({"|".join(re.escape(p) for p in FORBIDDEN_PATHS)})'
+    f'(?={_PATH_SEP_CLASS}|$)'
+)
+
+
+# (환경 변수 원본 값, 정규화된 루트) - 환경 변수가 바뀌지 않으면 resolve()를 다시 하지 않음
+_ROOT_CACHE: Tuple[Optional[str], Optional[Path]] = (None, None)
+
+
+# 백그라운드 작업 스레드는 제출 시점의 작업 영역을 사용 (pinned_target_root 참고)
+_PINNED_ROOT = threading.local()
+
+
+def _raw_target_root() -> Optional[str]:
+    """현재 스레드에 적용되는 작업 영역 원본 값 (고정된 값이 없으면 환경 변수)"""
+    if hasattr(_PINNED_ROOT, "raw"):
+        return _PINNED_ROOT.raw
+    return os.environ.get("MCP_FILE_AGENT_ROOT")
+
+
+@contextmanager
+def pinned_target_root(root: Optional[Path]) -> Iterator[None]:
+    """
+    현재 스레드에서 작업 영역을 root로 고정합니다.
+    실행 도중 configure_workspace가 호출되어도 고정된 루트로 검증합니다.
+    """
+    _PINNED_ROOT.raw = str(root) if root is not None else None
+    try:
+        yield
+    finally:
+        del _PINNED_ROOT.raw
+
 
 def get_target_root() -> Optional[Path]:
     """
     환경 변수에서 타겟 루트 디렉토리를 가져옵니다.
     설정되지 않은 경우 None을 반환합니다.
     """
-    root = os.environ.get("MCP_FILE_AGENT_ROOT")
-    if root:
-        return Path(root).resolve()
-    return None
+    global _ROOT_CACHE
+    root = _raw_target_root()
+    cached_raw, cached_root = _ROOT_CACHE
+    if root == cached_raw:
+        return cached_root
+    resolved = Path(root).resolve() if root else None
+    _ROOT_CACHE = (root, resolved)
+    return resolved
 
 
 def set_target_root(path: str) -> bool:
@@ -76,67 +182,147 @@ def set_target_root(path: str) -> bool:
     타겟 루트 디렉토리를 설정합니다.
     반환값: 성공 여부
     """
+    global _ROOT_CACHE
     try:
         resolved = Path(path).resolve()
-        if resolved.exists() and resolved.is_dir():
+        if resolved.is_dir():
             os.environ["MCP_FILE_AGENT_ROOT"] = str(resolved)
+            _ROOT_CACHE = (str(resolved), resolved)
+            clear_validation_cache()
             return True
         return False
     except Exception:
         return False
 
 
-def is_path_in_sandbox(path: Path, root: Path) -> bool:
+@lru_cache(maxsize=8)
+def _sandbox_prefix(root: Path) -> Tuple[str, str]:
+    """
+    샌드박스 루트의 비교용 문자열을 (루트, 루트 + 구분자) 형태로 한 번만 계산합니다.
+    """
+    root_str = os.path.normcase(os.path.realpath(root))
+    return root_str, root_str.rstrip(os.sep) + os.sep
+
+
+def _is_resolved_in_sandbox(resolved_str: str, root: Path) -> bool:
+    """
+    이미 정규화된 경로 문자열이 루트 내부에 있는지 접두사 비교로 확인합니다.
+    구분자까지 비교하므로 'D:\\Work2'가 'D:\\Work' 내부로 판정되지 않습니다.
+    """
+    root_str, root_prefix = _sandbox_prefix(root)
+    path_str = os.path.normcase(resolved_str)
+    return path_str == root_str or path_str.startswith(root_prefix)
+
+
+def is_path_in_sandbox(
+    path: Union[str, Path], root: Path, *, already_resolved: bool = False
+) -> bool:
     """
     주어진 경로가 샌드박스(루트 디렉토리) 내에 있는지 확인합니다.
+    already_resolved=True면 호출하는 쪽에서 이미 정규화한 경로로 보고 realpath를 생략합니다.
     """
     try:
-        resolved_path = path.resolve()
-        resolved_root = root.resolve()
-        # 경로가 루트로 시작하는지 확인
-        return str(resolved_path).startswith(str(resolved_root))
+        resolved_str = os.fspath(path) if already_resolved else os.path.realpath(path)
+        return _is_resolved_in_sandbox(resolved_str, root)
     except Exception:
         return False
 
 
-def is_forbidden_path(path: Path) -> Tuple[bool, Optional[str]]:
+def fast_resolve_str(path: Union[str, os.PathLike]) -> str:
+    """
+    경로를 절대 경로 문자열로 정규화합니다.
+    이미 절대 경로이고 심볼릭 링크가 아니면 구성 요소별 stat 없이 normpath만 적용하고,
+    그 외에는 os.path.realpath()로 완전히 해석합니다.
+    """
+    path_str = os.fspath(path)
+    if os.path.isabs(path_str) and not os.path.islink(path_str):
+        return os.path.normpath(path_str)
+    return os.path.realpath(path_str)
+
+
+def is_forbidden_path(path: Path, *, already_resolved: bool = False) -> Tuple[bool, Optional[str]]:
     """
     접근 금지된 시스템 경로인지 확인합니다.
+    already_resolved=True면 호출하는 쪽에서 이미 정규화한 경로로 보고 resolve()를 생략합니다.
     반환: (금지 여부, 이유)
     """
-    path_str = str(path.resolve())
-    path_parts = path.parts
+    path_str = str(path) if already_resolved else str(path.resolve())
     
-    # 시스템 드라이브 경로 체크
-    for forbidden in FORBIDDEN_DRIVE_PATHS:
-        if path_str.lower().startswith(forbidden.lower()):
-            return True, f"시스템 폴더 접근 금지: {forbidden}"
+    # 시스템 드라이브 경로 체크 (대소문자 무시)
+    match = _RE_FORBIDDEN_DRIVE.match(path_str.lower())
+    if match:
+        return True, f"시스템 폴더 접근 금지: {_FORBIDDEN_DRIVE_BY_LC[match.group()]}"
     
     # 폴더 이름 체크
-    for part in path_parts:
-        if part in FORBIDDEN_PATHS:
-            return True, f"금지된 폴더 접근: {part}"
+    match = _RE_FORBIDDEN_PART.search(str(path))
+    if match:
+        return True, f"금지된 폴더 접근: {match.group(1)}"
     
     return False, None
 
 
-def validate_path(path: str, must_exist: bool = True) -> PathValidationResult:
+# 검증에 성공한 절대 경로 결과 캐시: (경로, must_exist, 작업 영역) -> (realpath, PathValidationResult)
+_VALIDATION_CACHE: dict = {}
+_VALIDATION_CACHE_MAX = 4096
+
+
+def validate_path(path: Union[str, os.PathLike], must_exist: bool = True) -> PathValidationResult:
     """
     경로를 검증하고 안전한지 확인합니다.
+    검증에 성공한 절대 경로는 캐시하여 같은 경로의 반복 검증 시 금지 경로/샌드박스 검사를 생략합니다.
     
     Args:
-        path: 검증할 경로
+        path: 검증할 경로 (문자열 또는 Path 객체 - Path는 str로 다시 변환하지 않아도 됨)
         must_exist: True일 경우 경로가 존재해야 함
         
     Returns:
         PathValidationResult 객체
     """
     try:
-        # 경로 정규화
-        resolved = Path(path).resolve()
+        path = os.fspath(path)
+    except TypeError as e:
+        return PathValidationResult(
+            is_valid=False,
+            error_message=f"경로 검증 오류: {str(e)}"
+        )
+    
+    # 상대 경로는 현재 작업 디렉토리에 따라 결과가 달라지므로 캐시하지 않음
+    if not isinstance(path, str) or not os.path.isabs(path):
+        return _validate_path_uncached(path, must_exist)
+    
+    key = (path, must_exist, _raw_target_root())
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        # 심볼릭 링크가 바뀌면 작업 영역 밖을 가리킬 수 있으므로 realpath는 매번 다시 계산하고,
+        # 검증했던 realpath와 같을 때만 캐시를 사용 (존재 여부도 외부에서 바뀔 수 있으므로 재확인)
+        cached_real, cached_result = cached
+        if os.path.realpath(path) == cached_real and (
+            not must_exist or os.path.exists(cached_real)
+        ):
+            return cached_result
+    
+    result = _validate_path_uncached(path, must_exist)
+    if result.is_valid:
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_MAX:
+            _VALIDATION_CACHE.clear()
+        _VALIDATION_CACHE[key] = (str(result.resolved_path), result)
+    return result
+
+
+def clear_validation_cache() -> None:
+    """경로 검증 캐시를 비웁니다. (작업 영역 변경, 파일 시스템 변경 시)"""
+    _VALIDATION_CACHE.clear()
+
+
+def _validate_path_uncached(path: str, must_exist: bool) -> PathValidationResult:
+    """validate_path의 실제 검증 로직 (캐시 없음)"""
+    try:
+        # 경로 정규화 (os.path.realpath는 Path.resolve()보다 가볍습니다)
+        resolved_str = os.path.realpath(path)
+        resolved = Path(resolved_str)
         
         # 금지된 경로 체크
-        is_forbidden, reason = is_forbidden_path(resolved)
+        is_forbidden, reason = is_forbidden_path(resolved, already_resolved=True)
         if is_forbidden:
             return PathValidationResult(
                 is_valid=False,
@@ -145,7 +331,7 @@ def validate_path(path: str, must_exist: bool = True) -> PathValidationResult:
         
         # 타겟 루트 확인
         root = get_target_root()
-        if root and not is_path_in_sandbox(resolved, root):
+        if root and not is_path_in_sandbox(resolved_str, root, already_resolved=True):
             return PathValidationResult(
                 is_valid=False,
                 error_message=f"경로가 허용된 작업 영역 외부에 있습니다: {resolved}\n허용된 루트: {root}"
@@ -170,7 +356,7 @@ def validate_path(path: str, must_exist: bool = True) -> PathValidationResult:
         )
 
 
-def check_directory_depth(path: Path, max_depth: int = 5) -> Tuple[bool, int]:
+def check_directory_depth(path: Union[str, Path], max_depth: int = 5) -> Tuple[bool, int]:
     """
     디렉토리 깊이가 최대 제한을 초과하는지 확인합니다.
     
@@ -186,7 +372,7 @@ def check_directory_depth(path: Path, max_depth: int = 5) -> Tuple[bool, int]:
         return True, 0
     
     try:
-        resolved = path.resolve()
+        resolved = Path(path).resolve()
         relative = resolved.relative_to(root)
         depth = len(relative.parts)
         return depth <= max_depth, depth
@@ -195,43 +381,462 @@ def check_directory_depth(path: Path, max_depth: int = 5) -> Tuple[bool, int]:
         return True, 0
 
 
-def read_file_with_encoding(
-    path: Path, 
-    max_length: int = 5000
-) -> Tuple[str, str]:
+# ============================================================================
+# 디렉토리 스캔 캐시 (Directory Scan Cache)
+# ============================================================================
+
+# 스캔 캐시 DB 위치
+DIR_CACHE_PATH = Path.home() / ".cache" / "file-organization-agent" / "scan.db"
+
+# mtime 해상도가 낮은 파일 시스템에서 같은 틱 안의 변경을 놓치지 않도록
+# 최근(초 단위) 수정된 디렉토리는 캐시에 저장하지 않습니다.
+_DIR_CACHE_RACY_SECONDS = 2
+
+# 캐시 DB에 보관할 최대 디렉토리 수 (초과하면 가장 오래 갱신되지 않은 행부터 제거)
+_DIR_CACHE_MAX_ROWS = 200_000
+
+
+class DirCache:
+    """
+    디렉토리 직계 항목 목록을 SQLite에 저장하는 영구 캐시입니다.
+
+    디렉토리의 mtime은 항목이 추가/삭제/이름 변경될 때 갱신되므로,
+    mtime이 같다면 저장된 목록을 그대로 재사용할 수 있습니다.
+    하위 디렉토리는 각자의 mtime으로 따로 검증됩니다.
+
+    스캔 한 번에 하위 트리의 행을 한 번의 쿼리로 읽고(load_subtree),
+    스캔이 끝나면 변경된 행을 한 번의 트랜잭션으로 기록합니다(store_scan).
+    """
+
+    def __init__(self, db_path: Path = DIR_CACHE_PATH):
+        self._lock = threading.Lock()
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            # WAL + synchronous=NORMAL: 커밋마다 fsync하지 않음 (캐시이므로 유실되어도 재스캔)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS dir_cache ("
+                "abs_path TEXT PRIMARY KEY, dir_mtime INTEGER, stats_json TEXT)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error):
+            # 캐시를 사용할 수 없으면 항상 새로 스캔합니다.
+            self._conn = None
+
+    @staticmethod
+    def _subtree_range(root: str) -> Tuple[str, str]:
+        """root 하위 경로(root + 구분자로 시작)를 인덱스로 조회하기 위한 [하한, 상한) 범위"""
+        prefix = root.rstrip(os.sep) + os.sep
+        return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+    def load_subtree(self, root: str) -> dict:
+        """
+        root와 그 하위 디렉토리의 캐시 행을 한 번에 읽습니다.
+
+        Returns:
+            {절대 경로: (dir_mtime, stats_json)} (캐시를 사용할 수 없으면 빈 dict)
+        """
+        if self._conn is None:
+            return {}
+        low, high = self._subtree_range(root)
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT abs_path, dir_mtime, stats_json FROM dir_cache "
+                    "WHERE abs_path = ? OR (abs_path >= ? AND abs_path < ?)",
+                    (root, low, high),
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {abs_path: (dir_mtime, stats_json) for abs_path, dir_mtime, stats_json in rows}
+
+    def store_scan(
+        self, root: str, snapshot: dict, new_rows: list, scanned_paths: set
+    ) -> None:
+        """
+        스캔 결과를 한 번의 트랜잭션으로 기록합니다.
+
+        Args:
+            root: 스캔한 루트 디렉토리
+            snapshot: 스캔 전에 load_subtree로 읽은 행
+            new_rows: 새로 스캔한 디렉토리 [(절대 경로, dir_mtime, 항목 목록), ...]
+            scanned_paths: 이번 스캔에서 목록을 조회한 모든 디렉토리
+                           (snapshot에 있지만 여기에 없는 행은 삭제/이동된 디렉토리로 보고 제거)
+        """
+        if self._conn is None:
+            return
+        # 최근 수정된 디렉토리는 같은 mtime 틱 안의 변경을 놓칠 수 있으므로 저장하지 않음
+        racy_after = time.time_ns() - _DIR_CACHE_RACY_SECONDS * 1_000_000_000
+        rows = [
+            (abs_path, dir_mtime, json.dumps(entries, ensure_ascii=False))
+            for abs_path, dir_mtime, entries in new_rows
+            if dir_mtime < racy_after
+        ]
+        stale = [(abs_path,) for abs_path in snapshot if abs_path not in scanned_paths]
+        if not rows and not stale:
+            return
+        try:
+            with self._lock:
+                with self._conn:
+                    if stale:
+                        self._conn.executemany("DELETE FROM dir_cache WHERE abs_path = ?", stale)
+                    if rows:
+                        self._conn.executemany(
+                            "INSERT OR REPLACE INTO dir_cache VALUES (?, ?, ?)", rows
+                        )
+                    # 전체 행 수 상한: INSERT OR REPLACE는 rowid를 새로 받으므로
+                    # rowid가 작은 행이 가장 오래 갱신되지 않은 행
+                    self._conn.execute(
+                        "DELETE FROM dir_cache WHERE rowid IN ("
+                        "SELECT rowid FROM dir_cache ORDER BY rowid LIMIT max(0, "
+                        "(SELECT count(*) FROM dir_cache) - ?))",
+                        (_DIR_CACHE_MAX_ROWS,),
+                    )
+        except sqlite3.Error:
+            pass
+
+
+_dir_cache: Optional[DirCache] = None
+
+
+def get_dir_cache() -> DirCache:
+    """공유 DirCache 인스턴스를 반환합니다 (최초 호출 시 생성)."""
+    global _dir_cache
+    if _dir_cache is None:
+        _dir_cache = DirCache()
+    return _dir_cache
+
+
+# ============================================================================
+# 대용량 디렉토리 열거 (Large Directory Enumeration)
+# ============================================================================
+
+# 디렉토리 inode 크기가 이 값 이상이면 큰 버퍼로 직접 getdents64 호출
+# (ext4 기준 약 2만 개 이상의 항목)
+_LARGE_DIR_BYTES = 1 << 20
+_GETDENTS_BUFFER_SIZE = 1 << 20
+# linux_dirent64: d_ino(u64), d_off(s64), d_reclen(u16), d_type(u8), d_name[]
+_DIRENT64_HEADER = struct.Struct('=QqHB')
+_DT_UNKNOWN = 0
+_DT_DIR = 4
+_DT_REG = 8
+_DT_LNK = 10
+
+
+@lru_cache(maxsize=1)
+def _get_getdents64():
+    """glibc의 getdents64 함수를 반환합니다. (Linux/glibc 2.30+ 이외에는 None)"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        getdents64 = libc.getdents64
+    except (ImportError, OSError, AttributeError):
+        return None
+    getdents64.argtypes = (ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t)
+    getdents64.restype = ctypes.c_ssize_t
+    return getdents64
+
+
+class RawDirEntry:
+    """
+    getdents64 결과 항목 (os.DirEntry와 같은 name/path/inode/is_*/stat 인터페이스)
+    d_type으로 판별할 수 없는 경우(알 수 없는 타입, 링크 대상 확인)에만 stat을 호출합니다.
     """
-    파일을 여러 인코딩으로 시도하여 읽습니다.
-    Windows 환경에서 흔한 cp949/euc-kr도 지원합니다.
+    __slots__ = ('name', 'path', '_ino', '_d_type')
+
+    def __init__(self, dir_path: str, name: str, ino: int, d_type: int):
+        self.name = name
+        self.path = os.path.join(dir_path, name)
+        self._ino = ino
+        self._d_type = d_type
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<RawDirEntry {self.name!r}>"
+
+    def inode(self) -> int:
+        return self._ino
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        if self._d_type != _DT_UNKNOWN:
+            return self._d_type == _DT_LNK
+        return os.path.islink(self.path)
+
+    def _has_type(self, d_type: int, test, follow_symlinks: bool) -> bool:
+        if self._d_type == _DT_UNKNOWN or (follow_symlinks and self._d_type == _DT_LNK):
+            try:
+                return test(self.stat(follow_symlinks=follow_symlinks).st_mode)
+            except FileNotFoundError:
+                return False
+        return self._d_type == d_type
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return self._has_type(_DT_REG, stat.S_ISREG, follow_symlinks)
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._has_type(_DT_DIR, stat.S_ISDIR, follow_symlinks)
+
+
+def _iter_getdents64(getdents64, dir_path: str) -> Iterator[RawDirEntry]:
+    """큰 버퍼로 getdents64를 직접 호출하여 디렉토리 항목을 생성합니다."""
+    import ctypes
+    fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+    try:
+        buf = ctypes.create_string_buffer(_GETDENTS_BUFFER_SIZE)
+        while True:
+            n = getdents64(fd, buf, _GETDENTS_BUFFER_SIZE)
+            if n < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), dir_path)
+            if n == 0:
+                break
+            data = ctypes.string_at(buf, n)
+            pos = 0
+            while pos < n:
+                ino, _, reclen, d_type = _DIRENT64_HEADER.unpack_from(data, pos)
+                name_start = pos + _DIRENT64_HEADER.size
+                name_end = data.index(b'\0', name_start, pos + reclen)
+                name = os.fsdecode(data[name_start:name_end])
+                if name != '.' and name != '..':
+                    yield RawDirEntry(dir_path, name, ino, d_type)
+                pos += reclen
+    finally:
+        os.close(fd)
+
+
+def scandir_large(path: Union[str, os.PathLike], dir_size: Optional[int] = None) -> Iterator:
+    """
+    디렉토리 항목을 순회합니다.
+    항목이 매우 많은 디렉토리는 Linux에서 1MiB 버퍼로 getdents64를 직접 호출하여
+    readdir의 32KiB 버퍼 대비 시스템 호출 횟수를 줄이고, 그 외에는 os.scandir을 사용합니다.
     
     Args:
-        path: 읽을 파일 경로
-        max_length: 최대 읽을 글자 수
+        path: 디렉토리 경로
+        dir_size: 디렉토리의 st_size (호출하는 쪽에서 이미 stat한 경우 전달하면 stat을 생략)
+    
+    Returns:
+        os.DirEntry 또는 RawDirEntry 반복자
+    """
+    dir_path = os.fspath(path)
+    getdents64 = _get_getdents64()
+    if getdents64 is None:
+        with os.scandir(dir_path) as it:
+            yield from it
+        return
+    if dir_size is None:
+        dir_size = os.stat(dir_path).st_size
+    if dir_size >= _LARGE_DIR_BYTES:
+        yield from _iter_getdents64(getdents64, dir_path)
+        return
+    with os.scandir(dir_path) as it:
+        yield from it
+
+
+# ============================================================================
+# 분석 결과 메모리 캐시 (Analysis Result Cache)
+# ============================================================================
+
+# (함수명, 디렉토리 절대 경로, 작업 영역, 인자) -> (dir_mtime_ns, epoch, 결과)
+# 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+_SCAN_CACHE: OrderedDict = OrderedDict()
+_SCAN_CACHE_MAX = 256
+_SCAN_CACHE_LOCK = threading.Lock()
+# 변경 도구가 실행될 때마다 증가 (mtime 해상도가 낮은 파일 시스템 대비)
+_fs_epoch = 0
+
+
+def notify_fs_changed() -> None:
+    """
+    파일 시스템을 변경한 뒤 호출하여 메모리 분석 캐시와 경로 검증 캐시를 무효화합니다.
+    """
+    global _fs_epoch
+    with _SCAN_CACHE_LOCK:
+        _fs_epoch += 1
+        _SCAN_CACHE.clear()
+    clear_validation_cache()
+
+
+def cached_by_mtime(func):
+    """
+    디렉토리를 첫 인자로 받는 분석 도구의 결과를 디렉토리 mtime 기준으로 캐시합니다.
+    파일 이름 목록에만 의존하는 도구에만 사용하세요. (파일 내용/수정일 변경은 감지하지 못함)
+    디렉토리가 변경되었거나 notify_fs_changed()가 호출되면 다시 계산하며,
+    [ERROR] 결과는 캐시하지 않습니다.
+    결과 문구가 호출자마다 달라지지 않도록 func에는 검증된 절대 경로를 전달합니다.
+    """
+    @wraps(func)
+    def wrapper(directory: str, *args, **kwargs):
+        validation = validate_path(directory, must_exist=True)
+        if not validation.is_valid:
+            return func(directory, *args, **kwargs)
+        abs_path = str(validation.resolved_path)
+        try:
+            dir_mtime = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            return func(abs_path, *args, **kwargs)
+
+        key = (func.__name__, abs_path, str(get_target_root()), args, tuple(sorted(kwargs.items())))
+        with _SCAN_CACHE_LOCK:
+            epoch = _fs_epoch
+            cached = _SCAN_CACHE.get(key)
+            if cached is not None:
+                _SCAN_CACHE.move_to_end(key)
+        if cached is not None and cached[0] == dir_mtime and cached[1] == epoch:
+            return cached[2]
+
+        result = func(abs_path, *args, **kwargs)
+        # mtime이 방금 바뀐 디렉토리는 같은 시각 안에 외부에서 다시 바뀌어도 mtime이 같을 수 있으므로
+        # DirCache와 같은 기준(_DIR_CACHE_RACY_SECONDS)으로 캐시하지 않음
+        racy = time.time_ns() - dir_mtime < _DIR_CACHE_RACY_SECONDS * 1_000_000_000
+        if isinstance(result, str) and not result.startswith("[ERROR]") and not racy:
+            with _SCAN_CACHE_LOCK:
+                if epoch == _fs_epoch:
+                    _SCAN_CACHE[key] = (dir_mtime, epoch, result)
+                    _SCAN_CACHE.move_to_end(key)
+                    while len(_SCAN_CACHE) > _SCAN_CACHE_MAX:
+                        _SCAN_CACHE.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+# 인코딩 감지에 사용할 샘플 크기와 감지 결과를 신뢰할 최소 신뢰도
+ENCODING_SAMPLE_BYTES = 16384
+ENCODING_MIN_CONFIDENCE = 0.7
+
+# 감지기보다 먼저 엄격하게 시도하는 인코딩 (순서대로)
+_PREFERRED_ENCODINGS = ('utf-8', 'cp949', 'euc-kr')
+
+# BOM -> 인코딩 (긴 BOM을 먼저 비교)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def read_file_head(path: Path, size: int) -> Tuple[bytes, os.stat_result]:
+    """
+    파일을 한 번 열어 앞부분 size 바이트와 stat 결과를 함께 가져옵니다.
+    열린 파일 디스크립터에 fstat을 사용하므로 경로 기반 stat을 다시 호출하지 않습니다.
+    
+    Returns:
+        (읽은 바이트, os.stat_result)
+    """
+    # 버퍼링된 파일 객체 없이 저수준 os.open/os.read로 한 번에 읽음
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        st = os.fstat(fd)
+        raw = os.read(fd, size)
+        # 일반 파일은 보통 한 번에 다 읽히지만, 짧게 읽힌 경우 EOF까지 이어서 읽음
+        while raw and len(raw) < size:
+            more = os.read(fd, size - len(raw))
+            if not more:
+                break
+            raw += more
+    finally:
+        os.close(fd)
+    return raw, st
+
+
+def decode_text_bytes(raw: bytes, max_length: int, is_complete: bool) -> Tuple[str, str]:
+    """
+    파일 앞부분 바이트를 여러 인코딩으로 시도하여 디코딩합니다.
+    
+    Args:
+        raw: 파일 앞부분 바이트
+        max_length: 최대 반환할 글자 수
+        is_complete: raw가 파일 전체인지 여부 (False면 끝부분의 잘린 문자를 버림)
         
     Returns:
-        (파일 내용, 사용된 인코딩)
+        (디코딩된 내용, 사용된 인코딩)
     """
-    encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'latin-1']
+    # BOM이 있으면 감지 없이 해당 인코딩으로 바로 디코딩
+    for bom, encoding in _BOM_ENCODINGS:
+        if raw.startswith(bom):
+            try:
+                content = _decode_prefix(raw, encoding, is_complete)
+            except UnicodeDecodeError:
+                break
+            return content[:max_length], encoding
     
-    for encoding in encodings:
+    # 대부분의 파일은 UTF-8 또는 cp949/euc-kr이므로 감지기를 돌리기 전에 먼저 시도
+    # (짧은 한글 cp949 텍스트는 감지기가 big5 등으로 잘못 추정하는 경우가 있음)
+    for encoding in _PREFERRED_ENCODINGS:
         try:
-            with open(path, 'r', encoding=encoding) as f:
-                content = f.read(max_length)
-                return content, encoding
+            content = _decode_prefix(raw, encoding, is_complete)
         except UnicodeDecodeError:
             continue
-        except Exception as e:
-            raise e
+        return content[:max_length], encoding
     
-    # 모든 인코딩 실패 시 바이너리로 읽고 대체 문자 사용
-    with open(path, 'rb') as f:
-        raw = f.read(max_length)
-        return raw.decode('utf-8', errors='replace'), 'binary (fallback)'
+    # 모두 실패한 경우에만 인코딩 감지 결과를 사용하고, 마지막으로 latin-1
+    encodings = ['latin-1']
+    detected = _detect_encoding(raw[:ENCODING_SAMPLE_BYTES])
+    if detected is not None:
+        encodings.insert(0, detected)
+    
+    for encoding in encodings:
+        try:
+            content = _decode_prefix(raw, encoding, is_complete)
+        except (UnicodeDecodeError, LookupError):
+            # LookupError: 감지기가 Python이 모르는 코덱 이름을 반환한 경우
+            continue
+        return content[:max_length], encoding
+    
+    # 모든 인코딩 실패 시 대체 문자 사용
+    return raw.decode('utf-8', errors='replace')[:max_length], 'binary (fallback)'
+
+
+def _detect_encoding(sample: bytes) -> Optional[str]:
+    """
+    샘플 바이트의 인코딩을 감지합니다.
+    cchardet(신뢰도) 또는 charset-normalizer(1 - chaos)의 신뢰도가
+    ENCODING_MIN_CONFIDENCE를 넘을 때만 결과를 사용합니다. 감지 실패 시 None을 반환합니다.
+    """
+    if CCHARDET_AVAILABLE:
+        result = cchardet.detect(sample)
+        if result['encoding'] and (result['confidence'] or 0) > ENCODING_MIN_CONFIDENCE:
+            return result['encoding'].lower()
+        return None
+    
+    if CHARSET_DETECTION_AVAILABLE:
+        best = detect_charset(sample).best()
+        if best is not None and 1.0 - best.chaos > ENCODING_MIN_CONFIDENCE:
+            return best.encoding
+    return None
 
 
-def get_file_dates(path: Path) -> dict:
+def _decode_prefix(raw: bytes, encoding: str, is_complete: bool) -> str:
+    """
+    파일 앞부분 바이트를 디코딩합니다.
+    잘린 끝부분의 멀티바이트 문자는 오류 없이 버리고,
+    텍스트 모드 읽기와 같이 줄바꿈을 '\\n'으로 통일합니다.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    text = decoder.decode(raw, final=is_complete)
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def get_file_dates(
+    path: Union[Path, os.DirEntry], stat_result: Optional[os.stat_result] = None
+) -> dict:
     """
     파일의 날짜 정보를 가져옵니다.
     
+    Args:
+        path: 파일 경로 또는 os.scandir()의 DirEntry
+              (DirEntry는 캐시된 stat 결과를 재사용합니다)
+        stat_result: 이미 가져온 stat 결과 (주어지면 stat을 다시 호출하지 않음)
+    
     Returns:
         {
             'created': datetime,
@@ -241,12 +846,34 @@ def get_file_dates(path: Path) -> dict:
             'modified_str': 'YYMMDD' 형식
         }
     """
-    stat = path.stat()
+    st = stat_result if stat_result is not None else path.stat()
+    # 캐시된 dict를 호출자가 수정해도 영향이 없도록 복사본 반환
+    return dict(_format_file_dates(st.st_ctime, st.st_mtime, st.st_atime))
+
+
+def stat_and_dates(path: Union[str, os.PathLike]) -> Tuple[os.stat_result, dict]:
+    """
+    한 번의 os.stat으로 stat 결과와 날짜 정보를 함께 가져옵니다.
+    호출하는 쪽은 st_mode로 파일 여부를, st_size로 크기를 확인하여
+    is_file()/exists()/stat()을 따로 호출하지 않을 수 있습니다.
     
+    Returns:
+        (os.stat_result, get_file_dates와 같은 날짜 정보 dict)
+    """
+    st = os.stat(path)
+    return st, get_file_dates(path, st)
+
+
+@lru_cache(maxsize=4096)
+def _format_file_dates(ctime: float, mtime: float, atime: float) -> dict:
+    """
+    타임스탬프를 날짜 정보 dict로 변환합니다.
+    경로가 아닌 타임스탬프를 키로 캐시하므로 파일이 변경되면 자동으로 새로 계산됩니다.
+    """
     # Windows에서 st_ctime은 생성 시간
-    created = datetime.fromtimestamp(stat.st_ctime)
-    modified = datetime.fromtimestamp(stat.st_mtime)
-    accessed = datetime.fromtimestamp(stat.st_atime)
+    created = datetime.fromtimestamp(ctime)
+    modified = datetime.fromtimestamp(mtime)
+    accessed = datetime.fromtimestamp(atime)
     
     return {
         'created': created,
@@ -259,6 +886,35 @@ def get_file_dates(path: Path) -> dict:
     }
 
 
+def split_extension(name: str) -> Tuple[str, str]:
+    """
+    파일명을 (stem, suffix)로 나눕니다.
+    Path(name).stem / Path(name).suffix와 같은 결과를 Path 객체 생성 없이 계산합니다.
+    """
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ''
+
+
+def has_date_prefix(name: str) -> bool:
+    """
+    파일명이 'YYMMDD_' 날짜 접두사로 시작하는지 확인합니다.
+    정규식 r'^\d{6}_'와 같은 결과를 슬라이스 비교로 빠르게 계산합니다.
+    """
+    return len(name) >= 7 and name[6] == '_' and name[:6].isdecimal()
+
+
+# 파일/폴더 명명 규칙용 정규식 (호출마다 컴파일하지 않도록 모듈 수준에서 한 번만 컴파일)
+_RE_DATE_PREFIX = re.compile(r'^\d{6}_')
+_RE_FOLDER = re.compile(r'^(\d{2})_(.+)$')
+_RE_FOLDER_PREFIX = re.compile(r'^(\d{2})_')
+_RE_SPLIT_SEP = re.compile(r'[_\-\s]')
+
+# suggest_folder_prefix가 제안할 수 있는 번호(01~98)의 비트 마스크
+_FOLDER_NUMBER_MASK = (1 << 99) - 2
+
+
 def format_filename_with_date(
     original_name: str, 
     date: datetime,
@@ -281,14 +937,14 @@ def format_filename_with_date(
     date_str = date.strftime('%y%m%d')
     
     # 이미 날짜 접두사가 있는지 확인
-    date_pattern = re.compile(r'^\d{6}_')
-    if date_pattern.match(original_name):
+    if _RE_DATE_PREFIX.match(original_name):
         # 기존 날짜 교체
-        return date_pattern.sub(f'{date_str}_', original_name)
+        return _RE_DATE_PREFIX.sub(f'{date_str}_', original_name)
     
     return f'{date_str}_{original_name}'
 
 
+@lru_cache(maxsize=1024)
 def validate_folder_naming(name: str) -> Tuple[bool, Optional[str]]:
     """
     폴더 명명 규칙(00~99 접두사)을 확인합니다.
@@ -296,8 +952,7 @@ def validate_folder_naming(name: str) -> Tuple[bool, Optional[str]]:
     Returns:
         (규칙 준수 여부, 오류 메시지)
     """
-    pattern = re.compile(r'^(\d{2})_(.+)$')
-    match = pattern.match(name)
+    match = _RE_FOLDER.match(name)
     
     if not match:
         return False, "폴더 이름은 'NN_이름' 형식이어야 합니다 (예: 01_Project)"
@@ -316,69 +971,108 @@ def suggest_folder_prefix(existing_folders: list[str]) -> str:
     Returns:
         제안 접두사 (예: '05')
     """
-    pattern = re.compile(r'^(\d{2})_')
-    used_numbers = set()
+    # 사용 중인 번호를 비트로 표시 (n번 비트 = 'nn_' 사용 중)
+    used_bits = 0
     
     for folder in existing_folders:
-        match = pattern.match(folder)
+        match = _RE_FOLDER_PREFIX.match(folder)
         if match:
-            used_numbers.add(int(match.group(1)))
+            used_bits |= 1 << int(match.group(1))
     
-    # 다음 사용 가능한 번호 찾기 (99는 Archive 용으로 예약)
-    for i in range(1, 99):
-        if i not in used_numbers:
-            return f'{i:02d}'
+    # 다음 사용 가능한 번호 찾기 (01~98 중 가장 작은 빈 번호, 99는 Archive 용으로 예약)
+    free_bits = ~used_bits & _FOLDER_NUMBER_MASK
+    if free_bits:
+        return f'{(free_bits & -free_bits).bit_length() - 1:02d}'
     
     return '98'  # fallback
 
 
-def is_binary_file(path: Path) -> bool:
+# 텍스트로 읽을 수 있는 파일 확장자 (모듈 로드 시 한 번만 생성)
+READABLE_EXTENSIONS = frozenset({
+    # 코드/텍스트 파일
+    '.py', '.txt', '.md', '.js', '.ts', '.jsx', '.tsx',
+    '.html', '.css', '.scss', '.json', '.xml', '.yaml', '.yml',
+    '.java', '.c', '.cpp', '.h', '.hpp', '.cs', '.go', '.rs',
+    '.sh', '.bat', '.ps1', '.sql', '.r', '.rb', '.php',
+    '.ini', '.cfg', '.conf', '.log', '.csv',
+    # 문서 파일 (별도 처리 필요)
+    '.docx', '.pdf',
+})
+
+# 이미지 파일 확장자
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'})
+
+# 확장자만으로 텍스트/바이너리를 판별할 수 있는 확장자
+_TEXT_EXTENSIONS = READABLE_EXTENSIONS - {'.docx', '.pdf'}
+_BINARY_EXTENSIONS = IMAGE_EXTENSIONS | {
+    '.docx', '.pdf', '.zip', '.exe', '.dll', '.so', '.mp4', '.mp3',
+}
+
+# 바이너리 판별에 사용하는 파일 앞부분 크기
+BINARY_SNIFF_BYTES = 8192
+
+# 텍스트로 간주하는 바이트 (제어 문자 일부 + 0x20 이상, DEL 제외)
+# (bytes.translate의 삭제 대상으로 사용하여 텍스트 바이트를 C 수준에서 한 번에 제거)
+_TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f}))
+
+
+def binary_by_extension(name: str) -> Optional[bool]:
     """
-    파일이 바이너리인지 텍스트인지 추정합니다.
+    확장자만으로 바이너리 여부를 판별합니다.
+    
+    Returns:
+        True(바이너리), False(텍스트), 확장자로 알 수 없으면 None
     """
-    try:
-        with open(path, 'rb') as f:
-            chunk = f.read(8192)
-            # NULL 바이트가 있으면 바이너리로 간주
-            if b'\x00' in chunk:
-                return True
-            
-            # 대부분의 바이트가 텍스트 범위 내인지 확인
-            text_chars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
-            non_text = sum(1 for byte in chunk if byte not in text_chars)
-            return non_text / len(chunk) > 0.3 if chunk else False
-    except Exception:
+    ext = split_extension(name)[1].lower()
+    if ext in _TEXT_EXTENSIONS:
+        return False
+    if ext in _BINARY_EXTENSIONS:
         return True
+    return None
+
+
+def is_binary_bytes(chunk: bytes) -> bool:
+    """
+    파일 앞부분 바이트(앞 BINARY_SNIFF_BYTES만 사용)가 바이너리인지 추정합니다.
+    """
+    chunk = chunk[:BINARY_SNIFF_BYTES]
+    if not chunk:
+        return False
+    # NULL 바이트가 있으면 바이너리로 간주 (대부분의 바이너리는 여기서 판별됨)
+    if b'\x00' in chunk:
+        return True
+    
+    # NULL 바이트가 없으면 대부분의 바이트가 텍스트 범위 내인지 확인
+    non_text = len(chunk.translate(None, _TEXT_BYTES))
+    return non_text / len(chunk) > 0.3
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def get_file_size_str(size_bytes: int) -> str:
     """
     바이트 크기를 읽기 쉬운 문자열로 변환합니다.
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # 2^(10*i) 이상이면 i번째 단위 (bit_length로 단위를 바로 계산)
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
+
+
+# Windows에서 파일명에 사용할 수 없는 문자(예약 문자 + 제어 문자 0x00~0x1F) -> '_'
+_SANITIZE_TABLE = str.maketrans(
+    {char: '_' for char in '<>:"/\\|?*' + ''.join(map(chr, range(0x20)))}
+)
 
 
 def sanitize_filename(filename: str) -> str:
     """
     파일명에서 불법 문자를 제거합니다.
     """
-    # Windows에서 사용할 수 없는 문자들
-    illegal_chars = r'<>:"/\|?*'
-    for char in illegal_chars:
-        filename = filename.replace(char, '_')
-    
-    # 앞뒤 공백 및 점 제거
-    filename = filename.strip(' .')
-    
-    # 빈 문자열 방지
-    if not filename:
-        filename = 'unnamed'
-    
-    return filename
+    # 사용할 수 없는 문자를 한 번의 translate로 치환하고 앞뒤 공백/점 제거 (빈 문자열 방지)
+    return filename.translate(_SANITIZE_TABLE).strip(' .') or 'unnamed'
 
 
 # ============================================================================
@@ -386,9 +1080,70 @@ def sanitize_filename(filename: str) -> str:
 # ============================================================================
 
 
+# .docx 본문(word/document.xml)의 WordprocessingML 태그
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_PARAGRAPH = _W_NS + 'p'
+_W_TEXT = _W_NS + 't'
+_W_TAB = _W_NS + 'tab'
+_W_BREAKS = frozenset({_W_NS + 'br', _W_NS + 'cr'})
+# w:document(1) > w:body(2) > 본문 문단/표(3)
+_DOCX_BODY_CHILD_DEPTH = 3
+
+
+def _read_docx_text_fast(path: Path, max_length: int) -> str:
+    """
+    .docx(zip)의 word/document.xml을 스트리밍 파싱하여 문단 텍스트를 읽습니다.
+    python-docx로 전체 문서 객체를 만들지 않고 max_length에 도달하면 바로 중단합니다.
+    python-docx의 Document.paragraphs와 같이 본문(w:body) 바로 아래 문단만 읽고,
+    표 셀/텍스트 상자 안의 문단은 제외합니다.
+    """
+    paragraphs = []
+    # 열려 있는 문단별 텍스트 조각 (중첩 문단의 텍스트가 바깥 문단에 섞이지 않도록 스택으로 관리)
+    open_runs = []
+    # '\n'.join(paragraphs)의 길이를 누적 계산
+    total_length = -1
+    depth = 0
+    
+    with zipfile.ZipFile(path) as zf, zf.open('word/document.xml') as xml_file:
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                depth += 1
+                if tag == _W_PARAGRAPH:
+                    open_runs.append([])
+                continue
+            
+            elem_depth = depth
+            depth -= 1
+            if tag == _W_TEXT:
+                if elem.text and open_runs:
+                    open_runs[-1].append(elem.text)
+            elif tag == _W_TAB:
+                # 문단 속성의 탭 정지 위치(w:tabs/w:tab)는 속성이 있으므로 제외
+                if not elem.attrib and open_runs:
+                    open_runs[-1].append('\t')
+            elif tag in _W_BREAKS:
+                if open_runs:
+                    open_runs[-1].append('\n')
+            elif tag == _W_PARAGRAPH:
+                runs = open_runs.pop()
+                if elem_depth == _DOCX_BODY_CHILD_DEPTH:
+                    text = ''.join(runs)
+                    paragraphs.append(text)
+                    total_length += len(text) + 1
+                    if total_length >= max_length:
+                        break
+            if elem_depth == _DOCX_BODY_CHILD_DEPTH:
+                # 처리가 끝난 본문 항목(문단, 표 등)은 메모리에서 해제
+                elem.clear()
+    
+    return '\n'.join(paragraphs)[:max_length]
+
+
 def read_docx_content(path: Path, max_length: int = 1000) -> Tuple[str, bool]:
     """
     Word 문서(.docx)의 텍스트 내용을 읽습니다.
+    zip/XML 직접 파싱을 먼저 시도하고, 실패하면 python-docx로 읽습니다.
     
     Args:
         path: 읽을 파일 경로
@@ -397,15 +1152,24 @@ def read_docx_content(path: Path, max_length: int = 1000) -> Tuple[str, bool]:
     Returns:
         (내용, 성공 여부)
     """
-    if not DOCX_AVAILABLE:
-        return "[ERROR] python-docx 라이브러리가 설치되지 않았습니다. 'pip install python-docx' 명령으로 설치하세요.", False
+    try:
+        return _read_docx_text_fast(path, max_length), True
+    except Exception as e:
+        fast_error = str(e)
+    
+    DocxDocument = _get_docx_document()
+    if DocxDocument is None:
+        return f"[ERROR] Word 문서 읽기 오류: {fast_error}", False
     
     try:
         doc = DocxDocument(str(path))
         full_text = []
+        # '\n'.join(full_text)의 길이를 누적 계산 (매번 join하지 않음)
+        total_length = -1
         for para in doc.paragraphs:
             full_text.append(para.text)
-            if len('\n'.join(full_text)) >= max_length:
+            total_length += len(para.text) + 1
+            if total_length >= max_length:
                 break
         
         content = '\n'.join(full_text)[:max_length]
@@ -414,6 +1178,28 @@ def read_docx_content(path: Path, max_length: int = 1000) -> Tuple[str, bool]:
         return f"[ERROR] Word 문서 읽기 오류: {str(e)}", False
 
 
+# 이 크기 이하의 파일은 한 번에 메모리로 읽어 파서에 BytesIO로 전달
+IN_MEMORY_READ_LIMIT = 50 * 1024 * 1024
+
+
+def open_for_parsing(path: Path, size: Optional[int] = None) -> Union[BytesIO, str]:
+    """
+    파서(PyPDF2/PIL)에 넘길 입력을 준비합니다.
+    IN_MEMORY_READ_LIMIT 이하의 파일은 한 번에 읽어 BytesIO로 반환하여
+    파서가 파일에 작은 seek/read를 반복하지 않도록 하고, 큰 파일은 경로 문자열을 반환합니다.
+    
+    Args:
+        path: 파일 경로
+        size: 이미 알고 있는 파일 크기 (주어지면 stat을 다시 호출하지 않음)
+    """
+    if size is None:
+        size = os.stat(path).st_size
+    if size > IN_MEMORY_READ_LIMIT:
+        return str(path)
+    with open(path, 'rb') as f:
+        return BytesIO(f.read())
+
+
 def read_pdf_content(path: Path, max_length: int = 1000) -> Tuple[str, bool]:
     """
     PDF 파일의 텍스트 내용을 읽습니다.
@@ -425,18 +1211,25 @@ def read_pdf_content(path: Path, max_length: int = 1000) -> Tuple[str, bool]:
     Returns:
         (내용, 성공 여부)
     """
-    if not PDF_AVAILABLE:
+    if _get_fitz() is not None:
+        return _read_pdf_content_mupdf(path, max_length)
+    
+    PdfReader = _get_pdf_reader()
+    if PdfReader is None:
         return "[ERROR] PyPDF2 라이브러리가 설치되지 않았습니다. 'pip install PyPDF2' 명령으로 설치하세요.", False
     
     try:
-        reader = PdfReader(str(path))
+        reader = PdfReader(open_for_parsing(path))
         full_text = []
+        # '\n'.join(full_text)의 길이를 누적 계산 (매번 join하지 않음)
+        total_length = 0
         
         for page in reader.pages:
             text = page.extract_text()
             if text:
+                total_length += len(text) + (1 if full_text else 0)
                 full_text.append(text)
-            if len('\n'.join(full_text)) >= max_length:
+            if total_length >= max_length:
                 break
         
         content = '\n'.join(full_text)[:max_length]
@@ -445,18 +1238,73 @@ def read_pdf_content(path: Path, max_length: int = 1000) -> Tuple[str, bool]:
         return f"[ERROR] PDF 읽기 오류: {str(e)}", False
 
 
-def get_readable_extensions() -> set:
+def _read_pdf_content_mupdf(path: Path, max_length: int) -> Tuple[str, bool]:
+    """PyMuPDF(fitz)로 PDF 텍스트를 읽습니다. (read_pdf_content의 빠른 경로)"""
+    fitz = _get_fitz()
+    try:
+        with fitz.open(str(path)) as doc:
+            full_text = []
+            total_length = 0
+            for page in doc:
+                text = page.get_text()
+                if text:
+                    total_length += len(text) + (1 if full_text else 0)
+                    full_text.append(text)
+                if total_length >= max_length:
+                    break
+        
+        content = '\n'.join(full_text)[:max_length]
+        return content, True
+    except Exception as e:
+        return f"[ERROR] PDF 읽기 오류: {str(e)}", False
+
+
+def read_pdf_metadata(path: Path) -> Optional[dict]:
+    """
+    PDF 본문 텍스트를 추출하지 않고 문서 정보(제목, 작성자)와 페이지 수만 읽습니다.
+    파일 전체를 메모리로 읽지 않고 트레일러/상호 참조 테이블만 따라가므로
+    페이지 수나 제목만 필요한 경우 read_pdf_content보다 훨씬 가볍습니다.
+    
+    Args:
+        path: 읽을 파일 경로
+        
+    Returns:
+        {'title': str | None, 'author': str | None, 'pages': int}
+        (PDF 라이브러리가 없거나 읽기에 실패하면 None)
+    """
+    try:
+        fitz = _get_fitz()
+        if fitz is not None:
+            with fitz.open(str(path)) as doc:
+                info = doc.metadata or {}
+                return {
+                    'title': info.get('title') or None,
+                    'author': info.get('author') or None,
+                    'pages': doc.page_count,
+                }
+        
+        PdfReader = _get_pdf_reader()
+        if PdfReader is None:
+            return None
+        
+        reader = PdfReader(str(path))
+        info = reader.metadata
+        return {
+            'title': (info.title if info else None) or None,
+            'author': (info.author if info else None) or None,
+            'pages': len(reader.pages),
+        }
+    except Exception:
+        return None
+
+
+def get_readable_extensions() -> frozenset:
     """텍스트로 읽을 수 있는 파일 확장자 목록을 반환합니다."""
-    return {
-        # 코드/텍스트 파일
-        '.py', '.txt', '.md', '.js', '.ts', '.jsx', '.tsx',
-        '.html', '.css', '.scss', '.json', '.xml', '.yaml', '.yml',
-        '.java', '.c', '.cpp', '.h', '.hpp', '.cs', '.go', '.rs',
-        '.sh', '.bat', '.ps1', '.sql', '.r', '.rb', '.php',
-        '.ini', '.cfg', '.conf', '.log', '.csv',
-        # 문서 파일 (별도 처리 필요)
-        '.docx', '.pdf',
-    }
+    return READABLE_EXTENSIONS
+
+
+# 이 크기 이하이고 리사이즈/변환이 필요 없는 이미지는 원본 바이트를 그대로 사용
+IMAGE_PASSTHROUGH_MAX_BYTES = 200_000
 
 
 def encode_image_to_base64(path: Path, max_size: int = 512) -> Tuple[str, str, bool]:
@@ -471,9 +1319,8 @@ def encode_image_to_base64(path: Path, max_size: int = 512) -> Tuple[str, str, b
     Returns:
         (base64_data, mime_type, 성공 여부)
     """
-    try:
-        from PIL import Image
-    except ImportError:
+    Image = _get_pil_image()
+    if Image is None:
         return "", "", False
     
     # MIME 타입 결정
@@ -490,34 +1337,188 @@ def encode_image_to_base64(path: Path, max_size: int = 512) -> Tuple[str, str, b
     mime_type = mime_types.get(ext, 'image/jpeg')
     
     try:
-        with Image.open(path) as img:
+        source = open_for_parsing(path)
+        with Image.open(source) as img:
+            # 이미 작은 이미지는 디코딩/재인코딩 없이 원본 바이트를 그대로 인코딩
+            # (Image.open은 헤더만 읽으므로 크기/형식 확인에 픽셀 디코딩이 필요 없음)
+            if (
+                isinstance(source, BytesIO)
+                and source.getbuffer().nbytes <= IMAGE_PASSTHROUGH_MAX_BYTES
+                and max(img.size) <= max_size
+                and Image.MIME.get(img.format) == mime_type
+            ):
+                with source.getbuffer() as view:
+                    return base64.b64encode(view).decode('ascii'), mime_type, True
+            
             # RGBA를 RGB로 변환 (JPEG 저장을 위해)
             if img.mode == 'RGBA' and mime_type == 'image/jpeg':
                 img = img.convert('RGB')
             
             # 리사이즈 필요 여부 확인
             if max(img.size) > max_size:
-                ratio = max_size / max(img.size)
-                new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
+                # JPEG는 DCT 축소 디코딩으로 전체 해상도 디코딩을 생략
+                img.draft('RGB', (max_size, max_size))
+                # thumbnail은 비율을 유지하며 제자리에서 축소
+                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
             
             # Base64 인코딩
             buffer = BytesIO()
             save_format = 'JPEG' if ext in ['.jpg', '.jpeg'] else ext[1:].upper()
             if save_format == 'JPG':
                 save_format = 'JPEG'
-            img.save(buffer, format=save_format)
+            save_options = {'quality': 80} if save_format == 'JPEG' else {}
+            img.save(buffer, format=save_format, **save_options)
             
-            base64_data = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            # getbuffer()는 복사 없는 memoryview (getvalue()의 bytes 복사 생략)
+            with buffer.getbuffer() as view:
+                base64_data = base64.b64encode(view).decode('ascii')
             return base64_data, mime_type, True
             
     except Exception as e:
         return f"[ERROR] 이미지 인코딩 오류: {str(e)}", "", False
 
 
-def get_image_extensions() -> set:
+def get_image_extensions() -> frozenset:
     """이미지 파일 확장자 목록을 반환합니다."""
-    return {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+    return IMAGE_EXTENSIONS
+
+
+# ============================================================================
+# 분석용 이미지 캐시 (Analysis Image Cache)
+# ============================================================================
+
+_IMG_CACHE_SIZE = 8
+# (절대 경로, mtime_ns, max_size) -> (리사이즈 후 인코딩된 바이트, 포맷)
+_IMG_CACHE: OrderedDict = OrderedDict()
+_IMG_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_image(path: Path, mtime_ns: int, max_size: int) -> Optional[Tuple[bytes, str]]:
+    """
+    리사이즈된 분석용 이미지를 캐시에서 가져옵니다.
+    파일이 수정되면 mtime이 달라지므로 자동으로 캐시 미스가 됩니다.
+    """
+    key = (str(path), mtime_ns, max_size)
+    with _IMG_CACHE_LOCK:
+        cached = _IMG_CACHE.get(key)
+        if cached is not None:
+            _IMG_CACHE.move_to_end(key)
+        return cached
+
+
+def put_cached_image(path: Path, mtime_ns: int, max_size: int, data: bytes, img_format: str) -> None:
+    """
+    리사이즈된 분석용 이미지를 캐시에 저장합니다. (최근 사용 순으로 최대 8개 유지)
+    """
+    key = (str(path), mtime_ns, max_size)
+    with _IMG_CACHE_LOCK:
+        _IMG_CACHE[key] = (data, img_format)
+        _IMG_CACHE.move_to_end(key)
+        while len(_IMG_CACHE) > _IMG_CACHE_SIZE:
+            _IMG_CACHE.popitem(last=False)
+
+
+# EXIF 직접 파싱 설정
+_EXIF_SCAN_BYTES = 65536  # JPEG APP1 세그먼트 최대 크기
+_EXIF_IFD_POINTER = 0x8769  # Exif 하위 IFD 오프셋 태그
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _read_tiff_ifd(tiff: bytes, offset: int, byte_order: str, tags: dict) -> None:
+    """TIFF IFD 하나를 읽어 ASCII/SHORT/LONG 단일 값 태그를 tags에 추가합니다."""
+    (count,) = struct.unpack_from(byte_order + 'H', tiff, offset)
+    for i in range(count):
+        entry = offset + 2 + i * 12
+        if entry + 12 > len(tiff):
+            break
+        tag, value_type, value_count = struct.unpack_from(byte_order + 'HHI', tiff, entry)
+
+        if value_type == 2:  # ASCII
+            if value_count <= 4:
+                raw = tiff[entry + 8:entry + 8 + value_count]
+            else:
+                (value_offset,) = struct.unpack_from(byte_order + 'I', tiff, entry + 8)
+                raw = tiff[value_offset:value_offset + value_count]
+            tags[tag] = raw.rstrip(b'\x00').decode('latin-1')
+        elif value_type == 3 and value_count == 1:  # SHORT
+            tags[tag] = struct.unpack_from(byte_order + 'H', tiff, entry + 8)[0]
+        elif value_type == 4 and value_count == 1:  # LONG
+            tags[tag] = struct.unpack_from(byte_order + 'I', tiff, entry + 8)[0]
+
+
+def _parse_tiff_exif(tiff: bytes) -> Optional[dict]:
+    """TIFF 형식 EXIF 블록에서 IFD0과 Exif IFD의 태그를 읽습니다."""
+    if tiff[:2] == b'II':
+        byte_order = '<'
+    elif tiff[:2] == b'MM':
+        byte_order = '>'
+    else:
+        return None
+
+    magic, ifd0_offset = struct.unpack_from(byte_order + 'HI', tiff, 2)
+    if magic != 42:
+        return None
+
+    tags = {}
+    _read_tiff_ifd(tiff, ifd0_offset, byte_order, tags)
+    exif_offset = tags.pop(_EXIF_IFD_POINTER, None)
+    if exif_offset:
+        _read_tiff_ifd(tiff, exif_offset, byte_order, tags)
+    return tags
+
+
+def read_exif_fast(path: Path) -> Optional[dict]:
+    """
+    JPEG APP1 / PNG eXIf 청크를 직접 파싱하여 EXIF 태그를 읽습니다.
+    PIL로 이미지를 열고 전체 태그를 디코딩하는 것보다 훨씬 가볍습니다.
+
+    Args:
+        path: 이미지 파일 경로
+
+    Returns:
+        {태그 ID: 값} 딕셔너리 (EXIF가 없으면 빈 딕셔너리),
+        직접 파싱할 수 없는 경우 None (PIL로 대체해야 함)
+    """
+    ext = path.suffix.lower()
+    if ext not in ('.jpg', '.jpeg', '.png'):
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            data = f.read(_EXIF_SCAN_BYTES)
+
+        if data[:2] == b'\xff\xd8':
+            # JPEG: SOS 이전의 마커 세그먼트에서 APP1 "Exif" 탐색
+            pos = 2
+            while pos + 4 <= len(data):
+                if data[pos] != 0xFF:
+                    return None
+                marker = data[pos + 1]
+                if marker == 0xFF:  # 채움 바이트
+                    pos += 1
+                    continue
+                if marker == 0xDA or marker == 0xD9:  # SOS / EOI
+                    return {}
+                (length,) = struct.unpack_from('>H', data, pos + 2)
+                if marker == 0xE1 and data[pos + 4:pos + 10] == b'Exif\x00\x00':
+                    return _parse_tiff_exif(data[pos + 10:pos + 2 + length])
+                pos += 2 + length
+            return None
+
+        if data[:8] == _PNG_SIGNATURE:
+            pos = 8
+            while pos + 8 <= len(data):
+                length, chunk_type = struct.unpack_from('>I4s', data, pos)
+                if chunk_type == b'eXIf':
+                    return _parse_tiff_exif(data[pos + 8:pos + 8 + length])
+                if chunk_type == b'IDAT':
+                    break
+                pos += 12 + length
+            return None
+
+        return None
+    except (OSError, struct.error):
+        return None
 
 
 def analyze_filename_patterns(filenames: list[str]) -> dict:
@@ -532,47 +1533,54 @@ def analyze_filename_patterns(filenames: list[str]) -> dict:
             'common_prefixes': ['project_', 'report_'],
             'common_keywords': ['2024', 'final'],
             'extension_groups': {'.py': ['a.py', 'b.py'], '.txt': ['c.txt']},
+            'prefix_groups': {'project': ['project_a.py', 'project-b.txt']},
         }
     """
-    from collections import Counter
-    
     result = {
         'common_prefixes': [],
         'common_keywords': [],
         'extension_groups': {},
+        'prefix_groups': {},
     }
     
     if not filenames:
         return result
     
-    # 확장자별 그룹핑
-    for fname in filenames:
-        path = Path(fname)
-        ext = path.suffix.lower()
-        if ext not in result['extension_groups']:
-            result['extension_groups'][ext] = []
-        result['extension_groups'][ext].append(fname)
-    
-    # 공통 접두사 찾기 (언더스코어나 하이픈 기준)
-    prefix_counter = Counter()
+    # 파일마다 한 번만 분리하여 확장자 그룹, 접두사, 키워드를 함께 집계
+    extension_groups = defaultdict(list)
+    # 단순 개수 세기는 Counter보다 dict.get이 가벼움
+    prefix_counter = {}
+    prefix_members = defaultdict(list)
+    keyword_counter = {}
+    
     for fname in filenames:
-        stem = Path(fname).stem
-        # 언더스코어 또는 하이픈으로 분리
-        parts = re.split(r'[_\-\s]', stem)
+        stem, ext = split_extension(fname)
+        extension_groups[ext.lower()].append(fname)
+        
+        # 언더스코어, 하이픈 또는 공백으로 분리
+        parts = _RE_SPLIT_SEP.split(stem)
+        
+        # 공통 접두사 (같은 순회에서 '접두사_' / '접두사-'로 시작하는 파일도 함께 모아
+        # 호출하는 쪽이 접두사마다 전체 파일 목록을 다시 훑지 않도록 함)
         if len(parts) > 1:
-            prefix_counter[parts[0]] += 1
+            prefix = parts[0]
+            prefix_counter[prefix] = prefix_counter.get(prefix, 0) + 1
+            if stem[len(prefix)] in '_-':
+                prefix_members[prefix].append(fname)
+        
+        # 공통 키워드 (3글자 이상만, 대소문자 무시)
+        for word in parts:
+            word = word.lower()
+            if len(word) >= 3:
+                keyword_counter[word] = keyword_counter.get(word, 0) + 1
+    
+    result['extension_groups'] = dict(extension_groups)
     
     # 2번 이상 나타나는 접두사
     result['common_prefixes'] = [prefix for prefix, count in prefix_counter.items() if count >= 2]
-    
-    # 공통 키워드 찾기
-    keyword_counter = Counter()
-    for fname in filenames:
-        stem = Path(fname).stem.lower()
-        words = re.split(r'[_\-\s]', stem)
-        for word in words:
-            if len(word) >= 3:  # 3글자 이상만
-                keyword_counter[word] += 1
+    result['prefix_groups'] = {
+        prefix: prefix_members.get(prefix, []) for prefix in result['common_prefixes']
+    }
     
     # 2번 이상 나타나는 키워드
     result['common_keywords'] = [kw for kw, count in keyword_counter.items() if count >= 2]
@@ -580,6 +1588,17 @@ def analyze_filename_patterns(filenames: list[str]) -> dict:
     return result
 
 
+# is_meaningless_filename용 정규식 (디렉토리 순회 루프에서 파일마다 호출되므로 미리 컴파일)
+_RE_ALNUM_ONLY = re.compile(r'^[a-zA-Z0-9]+$')
+# 해시값(8자 이상 16진수) 또는 UUID - 한 번의 match로 두 패턴 모두 확인
+_RE_HASH_OR_UUID = re.compile(
+    r'^(?:[a-f0-9]{8,}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})$',
+    re.IGNORECASE,
+)
+_VOWELS = frozenset('aeiouAEIOU')
+
+
+@lru_cache(maxsize=16384)
 def is_meaningless_filename(filename: str) -> bool:
     """
     파일명이 의미를 알 수 없는 문자열인지 판단합니다.
@@ -590,10 +1609,10 @@ def is_meaningless_filename(filename: str) -> bool:
     Returns:
         True if likely meaningless, False otherwise
     """
-    stem = Path(filename).stem
+    stem = split_extension(filename)[0]
     
     # 이미 날짜 접두사가 있는 파일은 정리된 파일로 간주
-    if re.match(r'^\d{6}_', stem):
+    if has_date_prefix(stem):
         return False
     
     # 너무 짧은 이름은 의미를 알 수 없는로 간주
@@ -601,21 +1620,18 @@ def is_meaningless_filename(filename: str) -> bool:
         return True
     
     # 알파벳+숫자만으로 구성된 경우 (단어 구분 없음)
-    if re.match(r'^[a-zA-Z0-9]+$', stem):
+    if _RE_ALNUM_ONLY.match(stem):
         # 연속된 숫자가 많으면 의미를 알 수 없는일 가능성
-        if len(re.findall(r'\d', stem)) > len(stem) * 0.5:
+        # (stem은 ASCII 영숫자뿐이므로 문자 단위 검사로 충분)
+        if sum(c.isdigit() for c in stem) > len(stem) * 0.5:
             return True
         # 모음이 거의 없으면 의미를 알 수 없는일 가능성 (자연어가 아님)
-        vowels = len(re.findall(r'[aeiouAEIOU]', stem))
+        vowels = sum(c in _VOWELS for c in stem)
         if vowels < len(stem) * 0.15:
             return True
     
-    # 해시값 같은 패턴 (8자 이상 영숫자 조합)
-    if re.match(r'^[a-f0-9]{8,}$', stem, re.IGNORECASE):
-        return True
-    
-    # UUID 패턴
-    if re.match(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$', stem, re.IGNORECASE):
+    # 해시값 같은 패턴 (8자 이상 영숫자 조합) 또는 UUID 패턴
+    if _RE_HASH_OR_UUID.match(stem):
         return True
     
     return False